@@ -2,6 +2,7 @@
 
 import logging
 import os
+import threading
 from typing import Dict, List, Optional, Set
 
 import requests
@@ -203,12 +204,16 @@ class PermissionManager:
 
 
 # Global instance
-_permission_manager = None
+_permission_manager: Optional[PermissionManager] = None
+_permission_manager_lock = threading.Lock()
 
 
 def get_permission_manager() -> PermissionManager:
     """Get the global permission manager instance."""
     global _permission_manager
     if _permission_manager is None:
-        _permission_manager = PermissionManager()
+        # Lock only the first build so concurrent requests share one instance
+        with _permission_manager_lock:
+            if _permission_manager is None:
+                _permission_manager = PermissionManager()
     return _permission_manager
@@ -40,7 +40,7 @@ class Urgency(Enum):
     LOW = "low"
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalV2:
     """Enhanced signal model with V2 features.
 
@@ -1,15 +1,16 @@
 """Slack app integration for interactive LobbyLens features."""
 
-import hashlib
+import binascii
 import hmac
 
 # import json  # Unused for now
 import logging
 import os
 import time
+from collections import OrderedDict
 
 # import urllib.parse  # Unused for now
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import requests
 
@@ -20,6 +21,9 @@ from .matching import MatchingService
 
 logger = logging.getLogger(__name__)
 
+# Watchlist confirmation prompts expire after 10 minutes
+CONFIRMATION_TTL_SECONDS = 600
+
 
 class SlackApp:
     """Handles Slack app interactions including slash commands and events."""
@@ -33,12 +37,28 @@ class SlackApp:
         self.bot_token = os.getenv("SLACK_BOT_TOKEN")
         self.signing_secret = os.getenv("SLACK_SIGNING_SECRET")
 
-        # Track pending confirmations
-        self.pending_confirmations: Dict[str, Any] = {}
+        # Track pending confirmations, oldest first so expiry pops from the front
+        self.pending_confirmations: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    @property
+    def signing_secret(self) -> Optional[str]:
+        """Slack signing secret used to verify incoming requests."""
+        return self._signing_secret
+
+    @signing_secret.setter
+    def signing_secret(self, value: Optional[str]) -> None:
+        self._signing_secret = value
+        # Encode once; verification hashes with the one-shot hmac.digest()
+        self._signing_secret_bytes = value.encode() if value else None
+
+    def verify_slack_request(
+        self, headers: Dict[str, str], body: Union[bytes, str]
+    ) -> bool:
+        """Verify that request came from Slack with proper signature validation.
 
-    def verify_slack_request(self, headers: Dict[str, str], body: str) -> bool:
-        """Verify that request came from Slack with proper signature validation."""
-        if not self.signing_secret:
+        ``body`` should be the raw request body; bytes are hashed as-is.
+        """
+        if self._signing_secret_bytes is None:
             # In production, this should be an error
             if settings.is_production():
                 logger.error("SLACK_SIGNING_SECRET not set in production!")
@@ -66,18 +86,14 @@ class SlackApp:
             logger.warning("Invalid Slack request timestamp")
             return False
 
-        # Create signature
-        sig_basestring = f"v0:{timestamp}:{body}"
-        expected_signature = (
-            "v0="
-            + hmac.new(
-                self.signing_secret.encode(),
-                sig_basestring.encode(),
-                hashlib.sha256,
-            ).hexdigest()
-        )
+        # Create signature over "v0:{timestamp}:{body}"
+        body_bytes = body if isinstance(body, bytes) else body.encode()
+        sig_basestring = b"v0:" + timestamp.encode() + b":" + body_bytes
+        mac = hmac.digest(self._signing_secret_bytes, sig_basestring, "sha256")
+        expected_signature = b"v0=" + binascii.hexlify(mac)
 
-        is_valid = hmac.compare_digest(expected_signature, signature)
+        # Compare as bytes: constant-time and safe for non-ASCII header values
+        is_valid = hmac.compare_digest(expected_signature, signature.encode())
         if not is_valid:
             logger.warning("Invalid Slack request signature")
 
@@ -224,14 +240,17 @@ class SlackApp:
             return {"response_type": "ephemeral", "text": result["message"]}
         elif result["status"] == "confirmation_needed":
             # Store pending confirmation
-            confirmation_key = f"{channel_id}:{user_id}:{int(time.time())}"
+            now = time.time()
+            confirmation_key = f"{channel_id}:{user_id}:{int(now)}"
             self.pending_confirmations[confirmation_key] = {
                 "search_term": result["search_term"],
                 "candidates": result["candidates"],
                 "channel_id": channel_id,
                 "user_id": user_id,
-                "timestamp": time.time(),
+                "timestamp": now,
             }
+            self.pending_confirmations.move_to_end(confirmation_key)
+            self._sweep_confirmations(now)
 
             # Post message asking for confirmation
             message = result["message"] + f"\n\n_Confirmation key: {confirmation_key}_"
@@ -240,6 +259,14 @@ class SlackApp:
         else:
             return {"response_type": "ephemeral", "text": result["message"]}
 
+    def _sweep_confirmations(self, now: float) -> None:
+        """Drop expired confirmations from the front of the insertion order."""
+        while self.pending_confirmations:
+            oldest = next(iter(self.pending_confirmations.values()))
+            if now - oldest["timestamp"] <= CONFIRMATION_TTL_SECONDS:
+                break
+            self.pending_confirmations.popitem(last=False)
+
     def _handle_watchlist_remove(
         self, search_term: str, channel_id: str
     ) -> Dict[str, str]:
@@ -765,6 +792,8 @@ class SlackApp:
         channel_id = event_data.get("channel", "")
         user_id = event_data.get("user", "")
 
+        self._sweep_confirmations(time.time())
+
         # Look for confirmation key in message
         confirmation_key = None
         for key in self.pending_confirmations:
@@ -784,7 +813,7 @@ class SlackApp:
             return None
 
         # Check if confirmation is still valid (within 10 minutes)
-        if time.time() - confirmation["timestamp"] > 600:
+        if time.time() - confirmation["timestamp"] > CONFIRMATION_TTL_SECONDS:
             del self.pending_confirmations[confirmation_key]
             return None
 
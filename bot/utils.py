@@ -1,5 +1,6 @@
 """Utility functions for LobbyLens."""
 
+import functools
 import os
 import re
 from datetime import datetime
@@ -60,8 +61,13 @@ def format_amount(amount: Optional[int]) -> str:
             return formatted.replace(".0B", "B")
 
 
+@functools.lru_cache(maxsize=1)
 def is_lda_enabled() -> bool:
-    """Check if LDA V1 features are enabled via feature flag."""
+    """Check if LDA V1 features are enabled via feature flag.
+
+    The flag is read once per process; call ``is_lda_enabled.cache_clear()``
+    after changing ``ENABLE_LDA_V1`` at runtime.
+    """
     return os.getenv("ENABLE_LDA_V1", "false").lower() == "true"
 
 
@@ -1,7 +1,7 @@
 """Web server for handling Slack events and slash commands with v2 system."""
 
 # Removed unused import
-import hashlib
+import binascii
 import hmac
 import logging
 import time
@@ -58,20 +58,17 @@ def verify_slack_request(request_obj: Any) -> bool:
 
     # Use the raw request body exactly as Slack sent it; altering order or encoding
     # will break signature verification.
-    body = request_obj.get_data(cache=True, as_text=True)
+    # Raw bytes also skip a decode/re-encode round trip of the payload.
+    body = request_obj.get_data(cache=True)
 
     # Create signature
-    sig_basestring = f"v0:{timestamp}:{body}"
-    expected_signature = (
-        "v0="
-        + hmac.new(
-            signing_secret.encode(),
-            sig_basestring.encode(),
-            hashlib.sha256,
-        ).hexdigest()
-    )
-
-    is_valid = hmac.compare_digest(expected_signature, signature)
+    sig_basestring = b"v0:" + timestamp.encode() + b":" + body
+    # One-shot digest; no HMAC object is built per request
+    mac = hmac.digest(signing_secret.encode(), sig_basestring, "sha256")
+    expected_signature = b"v0=" + binascii.hexlify(mac)
+
+    # Compare bytes: compare_digest raises TypeError on non-ASCII str input
+    is_valid = hmac.compare_digest(expected_signature, signature.encode())
     if not is_valid:
         logger.warning("Invalid Slack request signature")
 
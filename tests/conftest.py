@@ -1,16 +1,137 @@
 """Pytest configuration and fixtures."""
 
+import os
 import sqlite3
 import tempfile
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Generator
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Optional
 
 import pytest
 import requests_mock
 
-from bot.config import Settings
+# Prime the heavy bot.slack_app import graph once per (xdist) worker
+import bot.permissions  # noqa: F401
+import bot.slack_app  # noqa: F401
+from bot.config import Settings, settings
 from bot.notifiers.slack import SlackNotifier
+from bot.utils import is_lda_enabled
+
+if TYPE_CHECKING:
+    # bot.web_server pulls in bot.run and Flask; the web fixtures import it lazily
+    from tests.slack_stubs import CallRecorder, FakeSignalsDB, StubSlackApp
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run each test from its own temp dir.
+
+    Code under test falls back to relative SQLite paths (``signals.db``,
+    ``lobbywatch.db``); isolating the working directory keeps those files
+    per-test so tests stay independent under ``pytest-xdist``.
+    """
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture(autouse=True)
+def lda_flag_cache() -> Generator[None, None, None]:
+    """Re-read ``ENABLE_LDA_V1`` per test; ``is_lda_enabled`` caches it."""
+    is_lda_enabled.cache_clear()
+    yield
+    is_lda_enabled.cache_clear()
+
+
+@pytest.fixture
+def post_recorder() -> "CallRecorder":
+    """Record messages posted through a stubbed ``post_message``."""
+    from tests.slack_stubs import CallRecorder
+
+    return CallRecorder({"ok": True})
+
+
+@pytest.fixture
+def lda_stub(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    """Return an installer that enables LDA with a stubbed digest class.
+
+    Call it with an ``LDAFrontPageDigest`` stand-in and, optionally, the
+    permission manager that ``get_permission_manager`` should return.
+    LDA is enabled through the real ``ENABLE_LDA_V1`` flag.
+    """
+
+    def _install(lda_cls: type, permission_manager: Optional[Any] = None) -> None:
+        manager = permission_manager if permission_manager is not None else object()
+        monkeypatch.setattr("bot.lda_front_page_digest.LDAFrontPageDigest", lda_cls)
+        monkeypatch.setenv("ENABLE_LDA_V1", "true")
+        is_lda_enabled.cache_clear()
+        monkeypatch.setattr("bot.permissions._permission_manager", manager)
+
+    return _install
+
+
+@pytest.fixture(scope="session")
+def now_utc() -> datetime:
+    """One aware "now" shared by every test that only needs a recent timestamp."""
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="session")
+def web_slack_stub() -> "StubSlackApp":
+    """Stub Slack handler behind the shared ``web_app``."""
+    from tests.slack_stubs import StubSlackApp
+
+    return StubSlackApp()
+
+
+@pytest.fixture(autouse=True)
+def reset_web_slack_stub(request: pytest.FixtureRequest) -> None:
+    """Start each web test with a clean session ``web_slack_stub``.
+
+    Only tests that use the stub touch it, so other tests never build it.
+    """
+    if "web_slack_stub" in request.fixturenames:
+        request.getfixturevalue("web_slack_stub").reset()
+
+
+@pytest.fixture(scope="session")
+def web_app(
+    web_slack_stub: "StubSlackApp", tmp_path_factory: pytest.TempPathFactory
+) -> Any:
+    """Build the web server once per session (per xdist worker).
+
+    ``isolated_cwd`` moves every test to its own dir, so the app's relative
+    ``signals.db`` is created in a session dir and pinned to an absolute
+    path. Tests needing a different database patch ``web_slack_stub.database``.
+    """
+    from bot.web_server import create_web_server
+
+    with pytest.MonkeyPatch.context() as mp:
+        # Pin the SQLite backend even when DATABASE_URL is set in the env
+        mp.setattr(settings, "database_url", None)
+        mp.setattr(settings, "signals_database_url", None)
+        mp.chdir(tmp_path_factory.mktemp("web_app"))
+        app = create_web_server(slack_app=web_slack_stub, use_legacy_handlers=False)
+        database = web_slack_stub.database
+        database.db_path = os.path.abspath(database.db_path)
+    app.config["TESTING"] = True
+    return app
+
+
+@pytest.fixture(scope="session")
+def web_client(web_app: Any) -> Any:
+    """Test client for the shared ``web_app``."""
+    return web_app.test_client()
+
+
+@pytest.fixture
+def fake_db(
+    web_slack_stub: "StubSlackApp", monkeypatch: pytest.MonkeyPatch
+) -> "FakeSignalsDB":
+    """Swap the shared ``web_app`` database for a ``FakeSignalsDB``."""
+    from tests.slack_stubs import FakeSignalsDB
+
+    database = FakeSignalsDB()
+    monkeypatch.setattr(web_slack_stub, "database", database)
+    return database
 
 
 @pytest.fixture
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 import bot.web_server as web_server
 
@@ -13,10 +13,17 @@ class StubSlackApp:
     def __init__(self) -> None:
         self.watchlist: list[str] = []
         self.database: Any = None
+        self._factory_database: Any = None
 
     def set_database(self, database: Any) -> None:
         """Attach a database object when provided by the server factory."""
         self.database = database
+        self._factory_database = database
+
+    def reset(self) -> None:
+        """Drop per-test state; restore the database the factory attached."""
+        self.watchlist.clear()
+        self.database = self._factory_database
 
     def handle_slash_command(self, command_data: Dict[str, Any]) -> Dict[str, Any]:
         command = (command_data.get("command") or "").strip()
@@ -213,3 +220,44 @@ class StubSlackApp:
             f"• Surge threshold: {surge_threshold}%\n\n"
             "Usage: `/threshold set <number>`",
         }
+
+
+class CallRecorder:
+    """Callable stand-in that records the positional args of each call.
+
+    Returns ``result``, or raises it when it is an exception.
+    """
+
+    __slots__ = ("calls", "result")
+
+    def __init__(self, result: Any = None) -> None:
+        self.calls: List[Tuple[Any, ...]] = []
+        self.result = result
+
+    def __call__(self, *args: Any) -> Any:
+        self.calls.append(args)
+        if isinstance(self.result, BaseException):
+            raise self.result
+        return self.result
+
+
+class FakeSignalsDB:
+    """In-memory stand-in for the signals database used by slash commands.
+
+    Tests set ``channel_settings``, ``update_result`` or ``watchlist`` directly
+    to steer the command handlers.
+    """
+
+    def __init__(self) -> None:
+        self.channel_settings: Dict[str, Any] = {}
+        self.update_result = True
+        self.watchlist: List[str] = []
+
+    def get_channel_settings(self, channel_id: str) -> Dict[str, Any]:
+        return self.channel_settings
+
+    def update_channel_setting(self, channel_id: str, key: str, value: Any) -> bool:
+        return self.update_result
+
+    def get_watchlist(self, channel_id: str) -> List[str]:
+        return self.watchlist
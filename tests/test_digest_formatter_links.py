@@ -7,7 +7,7 @@ helper and render real URLs with appropriate labels.
 
 import os
 import sys
-from datetime import datetime, timezone
+from datetime import datetime
 
 # Add the bot directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -17,7 +17,7 @@ from bot.fr_digest import FRDigestFormatter  # noqa: E402
 from bot.signals import SignalType, SignalV2  # noqa: E402
 
 
-def test_digest_formatter_link_labels() -> None:
+def test_digest_formatter_link_labels(now_utc: datetime) -> None:
     """Test DigestFormatter uses correct labels by source."""
     fmt = DigestFormatter()
 
@@ -25,7 +25,7 @@ def test_digest_formatter_link_labels() -> None:
     fr_signal = SignalV2(
         source="federal_register",
         source_id="FR-2024-12345",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now_utc,
         title="Test FR Rule",
         link="https://www.federalregister.gov/doc/2024-12345",
         agency="EPA",
@@ -40,7 +40,7 @@ def test_digest_formatter_link_labels() -> None:
     regs_signal = SignalV2(
         source="regulations_gov",
         source_id="EPA-HQ-2025-0001",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now_utc,
         title="Test Docket",
         link="https://www.regulations.gov/docket/EPA-HQ-2025-0001",
         agency="EPA",
@@ -56,7 +56,7 @@ def test_digest_formatter_link_labels() -> None:
     regs_doc_signal = SignalV2(
         source="regulations_gov",
         source_id="EPA-HQ-2025-0002",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now_utc,
         title="Test Document",
         link="https://www.regulations.gov/document/EPA-HQ-2025-0002",
         agency="EPA",
@@ -72,7 +72,7 @@ def test_digest_formatter_link_labels() -> None:
     congress_signal = SignalV2(
         source="congress",
         source_id="HR1234",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now_utc,
         title="Test Bill",
         link="https://www.congress.gov/bill/118-congress/house-bill/1234",
         agency="Congress",
@@ -90,7 +90,7 @@ def test_digest_formatter_link_labels() -> None:
     unknown_signal = SignalV2(
         source="unknown",
         source_id="UNK-001",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now_utc,
         title="Test Unknown",
         link="https://example.com",
         signal_type=SignalType.NOTICE,
@@ -100,14 +100,14 @@ def test_digest_formatter_link_labels() -> None:
     assert "<https://example.com|View>" in line
 
 
-def test_digest_formatter_missing_url() -> None:
+def test_digest_formatter_missing_url(now_utc: datetime) -> None:
     """Test DigestFormatter handles missing URLs gracefully."""
     fmt = DigestFormatter()
 
     signal = SignalV2(
         source="federal_register",
         source_id="FR-2024-12345",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now_utc,
         title="Test Rule",
         link="",  # No URL
         agency="EPA",
@@ -119,14 +119,14 @@ def test_digest_formatter_missing_url() -> None:
     assert "Test Rule" in line
 
 
-def test_fr_digest_formatter_links() -> None:
+def test_fr_digest_formatter_links(now_utc: datetime) -> None:
     """Test FRDigestFormatter uses real links."""
     fmt = FRDigestFormatter()
 
     signal = SignalV2(
         source="federal_register",
         source_id="FR-2024-12345",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now_utc,
         title="Test FR Rule",
         link="https://www.federalregister.gov/doc/2024-12345",
         agency="EPA",
@@ -143,7 +143,7 @@ def test_fr_digest_formatter_links() -> None:
     signal_no_url = SignalV2(
         source="federal_register",
         source_id="FR-2024-12346",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now_utc,
         title="Test Rule No URL",
         link="",  # No URL
         agency="EPA",
@@ -157,14 +157,14 @@ def test_fr_digest_formatter_links() -> None:
     assert "Test Rule No URL" in line
 
 
-def test_fr_digest_faa_ads_bundle() -> None:
+def test_fr_digest_faa_ads_bundle(now_utc: datetime) -> None:
     """Test FRDigestFormatter FAA ADs bundle formatting."""
     fmt = FRDigestFormatter()
 
     faa_signal = SignalV2(
         source="federal_register",
         source_id="FAA-BUNDLE-001",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now_utc,
         title="FAA Airworthiness Directives — 5 notices today (Boeing, Airbus)",
         link="https://www.federalregister.gov/agencies/federal-aviation-administration",
         agency="Federal Aviation Administration",
@@ -183,7 +183,7 @@ def test_fr_digest_faa_ads_bundle() -> None:
     faa_signal_no_url = SignalV2(
         source="federal_register",
         source_id="FAA-BUNDLE-002",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now_utc,
         title="FAA Airworthiness Directives — 3 notices today (Boeing)",
         link="",  # No URL
         agency="Federal Aviation Administration",
@@ -196,14 +196,14 @@ def test_fr_digest_faa_ads_bundle() -> None:
     assert "FAA Airworthiness Directives" in line
 
 
-def test_fr_digest_outlier_item() -> None:
+def test_fr_digest_outlier_item(now_utc: datetime) -> None:
     """Test FRDigestFormatter outlier item formatting."""
     fmt = FRDigestFormatter()
 
     signal = SignalV2(
         source="federal_register",
         source_id="FR-2024-12347",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now_utc,
         title="Test Outlier Rule",
         link="https://www.federalregister.gov/doc/2024-12347",
         agency="EPA",
@@ -219,7 +219,7 @@ def test_fr_digest_outlier_item() -> None:
     signal_no_url = SignalV2(
         source="federal_register",
         source_id="FR-2024-12348",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now_utc,
         title="Test Outlier No URL",
         link="",  # No URL
         agency="EPA",
@@ -1,8 +1,12 @@
 """Tests for bot/signals.py - Enhanced signal model and rules engine."""
 
 # import json  # Unused import
+import functools
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional
+
+import pytest
 
 from bot.signals import (
     SignalDeduplicator,
@@ -14,7 +18,138 @@ from bot.signals import (
 
 # from unittest.mock import patch  # Unused import
 
-# import pytest  # Unused import
+_NOW = datetime.now(timezone.utc)
+
+# Enum members bound once for the parametrize tables and assertions
+_FINAL = SignalType.FINAL_RULE
+_PROPOSED = SignalType.PROPOSED_RULE
+_HEARING = SignalType.HEARING
+_MARKUP = SignalType.MARKUP
+_BILL = SignalType.BILL
+_DOCKET = SignalType.DOCKET
+_NOTICE = SignalType.NOTICE
+_U_CRIT = Urgency.CRITICAL
+_U_HIGH = Urgency.HIGH
+_U_MED = Urgency.MEDIUM
+_U_LOW = Urgency.LOW
+
+# Deadline offsets shared across tests
+_D2 = timedelta(days=2)
+_D5 = timedelta(days=5)
+_D10 = timedelta(days=10)
+_D14 = timedelta(days=14)
+_D15 = timedelta(days=15)
+_D20 = timedelta(days=20)
+_D30 = timedelta(days=30)
+
+
+class _UrgencyCase(NamedTuple):
+    source: str
+    title: str
+    signal_type: SignalType
+    deadline_delta: Optional[timedelta]
+    surge_pct: Optional[float]
+    expected: Urgency
+
+
+_URGENCY_CASES = (
+    # "critical" keyword wins over the final-rule default
+    _UrgencyCase(
+        "federal_register",
+        "Final Rule: Critical Regulation",
+        _FINAL,
+        _D15,
+        None,
+        _U_CRIT,
+    ),
+    _UrgencyCase(
+        "federal_register",
+        "Proposed Rule: Important Regulation",
+        _PROPOSED,
+        _D10,
+        None,
+        _U_MED,
+    ),
+    _UrgencyCase("congress", "Hearing: Important Topic", _HEARING, _D5, None, _U_HIGH),
+    _UrgencyCase("congress", "Hearing: Medium Priority", _HEARING, _D15, None, _U_HIGH),
+    _UrgencyCase("congress", "Floor Vote: Important Bill", _BILL, None, None, _U_LOW),
+    _UrgencyCase("congress", "Bill: Committee Referral", _BILL, None, None, _U_LOW),
+    _UrgencyCase("congress", "Bill: New Introduction", _BILL, None, None, _U_LOW),
+    # Comment surges do not raise docket urgency
+    _UrgencyCase(
+        "regulations_gov", "Docket: High Interest", _DOCKET, None, 250.0, _U_LOW
+    ),
+    _UrgencyCase("regulations_gov", "Docket: Active", _DOCKET, None, None, _U_LOW),
+    _UrgencyCase(
+        "federal_register", "Notice: General Information", _NOTICE, None, None, _U_MED
+    ),
+)
+
+# Serialized signal shared by the from_dict tests; variants override fields
+# with ``{**_BASE_SIGNAL_DICT, ...}`` so the template itself is never mutated.
+_BASE_SIGNAL_DICT: Mapping[str, Any] = MappingProxyType(
+    {
+        "source": "regulations_gov",
+        "source_id": "docket-456",
+        "title": "Docket Comment Period",
+        "link": "https://example.com/docket-456",
+        "timestamp": _NOW.isoformat(),
+        "issue_codes": ["ENV", "ENE"],
+        "bill_id": None,
+        "agency": "EPA",
+        "deadline": (_NOW + _D14).isoformat(),
+        "metrics": {"comments_24h_delta_pct": 150.0},
+        "signal_type": "docket",
+        "urgency": "medium",
+        "priority_score": 4.2,
+        "industry": "Environment",
+        "watchlist_hit": False,
+    }
+)
+
+# Minimal serialized signal with every optional field unset
+_NONE_SIGNAL_DICT: Mapping[str, Any] = MappingProxyType(
+    {
+        **_BASE_SIGNAL_DICT,
+        "source": "congress",
+        "source_id": "bill-789",
+        "title": "Simple Bill",
+        "link": "https://example.com/bill-789",
+        "issue_codes": [],
+        "agency": None,
+        "deadline": None,
+        "metrics": {},
+        "signal_type": None,
+        "urgency": None,
+        "priority_score": 0.0,
+        "industry": None,
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_none_signal() -> SignalV2:
+    """Parse _NONE_SIGNAL_DICT once; callers must treat the result as read-only."""
+    return SignalV2.from_dict(dict(_NONE_SIGNAL_DICT))
+
+
+def _make_signal(**overrides: Any) -> SignalV2:
+    """Build a SignalV2 with test defaults, overriding only the given fields."""
+    fields: Dict[str, Any] = {
+        "source": "congress",
+        "source_id": "bill-1",
+        "title": "Test Bill",
+        "timestamp": _NOW,
+    }
+    fields.update(overrides)
+    fields.setdefault("link", f"https://example.com/{fields['source_id']}")
+    return SignalV2(**fields)
+
+
+@pytest.fixture
+def engine() -> SignalsRulesEngine:
+    """Rules engine with no watchlist."""
+    return SignalsRulesEngine()
 
 
 class TestSignalV2:
@@ -32,7 +167,7 @@ class TestSignalV2:
             issue_codes=["HCR", "TEC"],
             bill_id="HR-123",
             agency="HHS",
-            deadline=(now + timedelta(days=30)).isoformat(),
+            deadline=(now + _D30).isoformat(),
             metrics={"comments_24h_delta_pct": 50.0},
         )
 
@@ -46,16 +181,13 @@ class TestSignalV2:
 
     def test_signal_to_dict(self) -> None:
         """Test signal serialization to dictionary."""
-        now = datetime.now(timezone.utc)
-        signal = SignalV2(
+        signal = _make_signal(
             source="federal_register",
             source_id="fr-123",
             title="Final Rule: Privacy",
-            link="https://example.com/fr-123",
-            timestamp=now,
             issue_codes=["TEC"],
-            signal_type=SignalType.FINAL_RULE,
-            urgency=Urgency.HIGH,
+            signal_type=_FINAL,
+            urgency=_U_HIGH,
             priority_score=7.5,
             industry="Tech",
             watchlist_hit=True,
@@ -73,26 +205,13 @@ class TestSignalV2:
         assert data["industry"] == "Tech"
         assert data["watchlist_hit"] is True
 
+        # Collections stay native; JSON encoding happens in the database layer
+        assert data["metrics"] == {}
+        assert SignalV2.from_dict(data) == signal
+
     def test_signal_from_dict(self) -> None:
         """Test signal deserialization from dictionary."""
-        now = datetime.now(timezone.utc)
-        data: Dict[str, Any] = {
-            "source": "regulations_gov",
-            "source_id": "docket-456",
-            "title": "Docket Comment Period",
-            "link": "https://example.com/docket-456",
-            "timestamp": now.isoformat(),
-            "issue_codes": ["ENV", "ENE"],
-            "bill_id": None,
-            "agency": "EPA",
-            "deadline": (now + timedelta(days=14)).isoformat(),
-            "metrics": {"comments_24h_delta_pct": 150.0},
-            "signal_type": "docket",
-            "urgency": "medium",
-            "priority_score": 4.2,
-            "industry": "Environment",
-            "watchlist_hit": False,
-        }
+        data: Dict[str, Any] = {**_BASE_SIGNAL_DICT}
 
         signal = SignalV2.from_dict(data)
 
@@ -101,34 +220,15 @@ class TestSignalV2:
         assert signal.title == "Docket Comment Period"
         assert signal.issue_codes == ["ENV", "ENE"]
         assert signal.agency == "EPA"
-        assert signal.signal_type == SignalType.DOCKET
-        assert signal.urgency == Urgency.MEDIUM
+        assert signal.signal_type == _DOCKET
+        assert signal.urgency == _U_MED
         assert signal.priority_score == 4.2
         assert signal.industry == "Environment"
         assert signal.watchlist_hit is False
 
     def test_signal_from_dict_with_none_values(self) -> None:
         """Test signal deserialization with None values."""
-        now = datetime.now(timezone.utc)
-        data: Dict[str, Any] = {
-            "source": "congress",
-            "source_id": "bill-789",
-            "title": "Simple Bill",
-            "link": "https://example.com/bill-789",
-            "timestamp": now.isoformat(),
-            "issue_codes": [],
-            "bill_id": None,
-            "agency": None,
-            "deadline": None,
-            "metrics": {},
-            "signal_type": None,
-            "urgency": None,
-            "priority_score": 0.0,
-            "industry": None,
-            "watchlist_hit": False,
-        }
-
-        signal = SignalV2.from_dict(data)
+        signal = _parse_none_signal()
 
         assert signal.bill_id is None
         assert signal.agency is None
@@ -138,6 +238,15 @@ class TestSignalV2:
         assert signal.urgency is None
         assert signal.industry is None
 
+    def test_signal_to_dict_with_none_values(self) -> None:
+        """Test None values survive serialization back to a dictionary."""
+        data = _parse_none_signal().to_dict()
+
+        assert data["signal_type"] is None
+        assert data["urgency"] is None
+        assert data["deadline"] is None
+        assert data["issue_codes"] == []
+
 
 class TestSignalsRulesEngine:
     """Tests for SignalsRulesEngine rules processing."""
@@ -153,456 +262,248 @@ class TestSignalsRulesEngine:
         engine = SignalsRulesEngine(watchlist)
         assert engine.watchlist == watchlist
 
-    def test_classify_signal_type_federal_register(self) -> None:
+    @pytest.mark.parametrize(
+        "title,expected",
+        [
+            # "Final Rule" in title
+            ("Final Rule: Privacy Protection", _FINAL),
+            ("interim final rule: Data Security", _FINAL),
+            # "proposed rule" in title
+            ("proposed rule: AI Regulation", _PROPOSED),
+            # "NPRM" maps to proposed rule
+            ("NPRM: Cybersecurity Standards", _PROPOSED),
+            # "Notice" in title
+            ("Notice: Public Meeting", _NOTICE),
+        ],
+    )
+    def test_classify_signal_type_federal_register(
+        self, engine: SignalsRulesEngine, title: str, expected: SignalType
+    ) -> None:
         """Test signal type classification for Federal Register."""
-        engine = SignalsRulesEngine()
-
-        # Final rule
-        signal = SignalV2(
+        signal = _make_signal(
             source="federal_register",
             source_id="fr-1",
-            title="Final Rule: Privacy Protection",
-            link="https://example.com/fr-1",
-            timestamp=datetime.now(timezone.utc),
+            title=title,
         )
-        signal_type = engine._classify_signal_type(signal)
-        assert signal_type == SignalType.FINAL_RULE  # "Final Rule" in title
-
-        # Interim final rule
-        signal.title = "interim final rule: Data Security"
-        signal_type = engine._classify_signal_type(signal)
-        assert signal_type == SignalType.FINAL_RULE  # "Final Rule" in title
-
-        # Proposed rule
-        signal.title = "proposed rule: AI Regulation"
-        # No summary field in SignalV2
-        signal_type = engine._classify_signal_type(signal)
-        assert signal_type == SignalType.PROPOSED_RULE  # "proposed rule" in title
-
-        # NPRM
-        signal.title = "NPRM: Cybersecurity Standards"
-        # No summary field in SignalV2
-        signal_type = engine._classify_signal_type(signal)
-        assert signal_type == SignalType.PROPOSED_RULE  # "NPRM" maps to proposed rule
-
-        # Notice
-        signal.title = "Notice: Public Meeting"
-        # No summary field in SignalV2
-        signal_type = engine._classify_signal_type(signal)
-        assert signal_type == SignalType.NOTICE  # "Notice" in title
-
-    def test_classify_signal_type_congress(self) -> None:
+        assert engine._classify_signal_type(signal) == expected
+
+    @pytest.mark.parametrize(
+        "title,committee,expected",
+        [
+            ("Hearing: AI Safety", "House Committee on Science", _HEARING),
+            # "markup" in title
+            ("markup: Privacy Bill", "House Committee on Judiciary", _MARKUP),
+            # Floor vote with no committee
+            ("Vote: Infrastructure Bill", None, _BILL),
+            # Regular bill with no committee
+            ("Education Reform Bill", None, _BILL),
+        ],
+    )
+    def test_classify_signal_type_congress(
+        self,
+        engine: SignalsRulesEngine,
+        title: str,
+        committee: Optional[str],
+        expected: SignalType,
+    ) -> None:
         """Test signal type classification for Congress."""
-        engine = SignalsRulesEngine()
-
-        # Hearing
-        signal = SignalV2(
-            source="congress",
-            source_id="congress-1",
-            title="Hearing: AI Safety",
-            link="https://example.com/hearing-1",
-            timestamp=datetime.now(timezone.utc),
-            committee="House Committee on Science",
-        )
-        signal_type = engine._classify_signal_type(signal)
-        assert signal_type == SignalType.HEARING
-
-        # Markup
-        signal.title = "markup: Privacy Bill"
-        signal.committee = "House Committee on Judiciary"
-        # No summary field in SignalV2
-        signal_type = engine._classify_signal_type(signal)
-        assert signal_type == SignalType.MARKUP  # "markup" in title
-
-        # Floor vote
-        # No action_type field in SignalV2
-        signal.title = "Vote: Infrastructure Bill"
-        signal.committee = None  # No committee
-        # No summary field in SignalV2
-        signal_type = engine._classify_signal_type(signal)
-        assert signal_type == SignalType.BILL
+        signal = _make_signal(source_id="congress-1", title=title, committee=committee)
+        assert engine._classify_signal_type(signal) == expected
 
-        # Regular bill
-        # No action_type field in SignalV2
-        signal.title = "Education Reform Bill"
-        signal.committee = None  # No committee
-        # No summary field in SignalV2
-        signal_type = engine._classify_signal_type(signal)
-        assert signal_type == SignalType.BILL
-
-    def test_classify_signal_type_regulations_gov(self) -> None:
+    def test_classify_signal_type_regulations_gov(
+        self, engine: SignalsRulesEngine
+    ) -> None:
         """Test signal type classification for Regulations.gov."""
-        engine = SignalsRulesEngine()
-
-        signal = SignalV2(
+        signal = _make_signal(
             source="regulations_gov",
             source_id="docket-1",
             title="Docket: Environmental Standards",
-            link="https://example.com/docket-1",
-            timestamp=datetime.now(timezone.utc),
         )
         signal_type = engine._classify_signal_type(signal)
-        assert signal_type == SignalType.DOCKET
-
-    def test_determine_urgency_critical(self) -> None:
-        """Test critical urgency determination."""
-        engine = SignalsRulesEngine()
-        now = datetime.now(timezone.utc)
-
-        # Final rule effective in 15 days (critical)
-        signal = SignalV2(
-            source="federal_register",
-            source_id="fr-1",
-            title="Final Rule: Critical Regulation",
-            link="https://example.com/fr-1",
-            timestamp=now,
-            deadline=(now + timedelta(days=15)).isoformat(),
-        )
-        signal.signal_type = SignalType.FINAL_RULE
-        urgency = engine._determine_urgency(signal)
-        assert urgency == Urgency.CRITICAL  # Final rule gets CRITICAL urgency
-
-    def test_determine_urgency_high(self) -> None:
-        """Test high urgency determination."""
-        engine = SignalsRulesEngine()
-        now = datetime.now(timezone.utc)
-
-        # Proposed rule with deadline in 10 days
-        signal = SignalV2(
-            source="federal_register",
-            source_id="fr-1",
-            title="Proposed Rule: Important Regulation",
-            link="https://example.com/fr-1",
-            timestamp=now,
-            deadline=(now + timedelta(days=10)).isoformat(),
-        )
-        signal.signal_type = SignalType.PROPOSED_RULE
-        urgency = engine._determine_urgency(signal)
-        assert urgency == Urgency.MEDIUM  # Proposed rule gets MEDIUM urgency
-
-        # Hearing in 5 days
-        signal = SignalV2(
-            source="congress",
-            source_id="congress-1",
-            title="Hearing: Important Topic",
-            link="https://example.com/hearing-1",
-            timestamp=now,
-            deadline=(now + timedelta(days=5)).isoformat(),
-        )
-        signal.signal_type = SignalType.HEARING
-        urgency = engine._determine_urgency(signal)
-        assert urgency == Urgency.HIGH  # Hearing gets HIGH urgency
-
-        # Floor vote
-        signal = SignalV2(
-            source="congress",
-            source_id="congress-1",
-            title="Floor Vote: Important Bill",
-            link="https://example.com/vote-1",
-            timestamp=now,
-        )
-        signal.signal_type = SignalType.BILL
-        # No action_type field in SignalV2
-        urgency = engine._determine_urgency(signal)
-        assert urgency == Urgency.LOW  # Bill gets LOW urgency
-
-        # Docket with 250% surge
-        signal = SignalV2(
-            source="regulations_gov",
-            source_id="docket-1",
-            title="Docket: High Interest",
-            link="https://example.com/docket-1",
-            timestamp=now,
-            metrics={"comments_24h_delta_pct": 250.0},
-        )
-        signal.signal_type = SignalType.DOCKET
-        urgency = engine._determine_urgency(signal)
-        assert urgency == Urgency.LOW  # Docket gets LOW urgency
-
-    def test_determine_urgency_medium(self) -> None:
-        """Test medium urgency determination."""
-        engine = SignalsRulesEngine()
-        now = datetime.now(timezone.utc)
-
-        # Hearing in 15 days
-        signal = SignalV2(
-            source="congress",
-            source_id="congress-1",
-            title="Hearing: Medium Priority",
-            link="https://example.com/hearing-1",
-            timestamp=now,
-            deadline=(now + timedelta(days=15)).isoformat(),
-        )
-        signal.signal_type = SignalType.HEARING
-        urgency = engine._determine_urgency(signal)
-        assert urgency == Urgency.HIGH  # Hearing gets HIGH urgency
-
-        # Docket with comments
-        signal = SignalV2(
-            source="regulations_gov",
-            source_id="docket-1",
-            title="Docket: Active",
-            link="https://example.com/docket-1",
-            timestamp=now,
-        )
-        signal.signal_type = SignalType.DOCKET
-        urgency = engine._determine_urgency(signal)
-        assert urgency == Urgency.LOW  # Docket gets LOW urgency
-
-        # Bill committee referral
-        signal = SignalV2(
-            source="congress",
-            source_id="congress-1",
-            title="Bill: Committee Referral",
-            link="https://example.com/bill-1",
-            timestamp=now,
-        )
-        signal.signal_type = SignalType.BILL
-        # No action_type field in SignalV2
-        urgency = engine._determine_urgency(signal)
-        assert urgency == Urgency.LOW  # Bill gets LOW urgency
-
-    def test_determine_urgency_low(self) -> None:
-        """Test low urgency determination."""
-        engine = SignalsRulesEngine()
-        now = datetime.now(timezone.utc)
-
-        # Bill introduced
-        signal = SignalV2(
-            source="congress",
-            source_id="congress-1",
-            title="Bill: New Introduction",
-            link="https://example.com/bill-1",
-            timestamp=now,
-        )
-        signal.signal_type = SignalType.BILL
-        # No action_type field in SignalV2
-        urgency = engine._determine_urgency(signal)
-        assert urgency == Urgency.LOW
-
-        # Notice
-        signal = SignalV2(
-            source="federal_register",
-            source_id="fr-1",
-            title="Notice: General Information",
-            link="https://example.com/fr-1",
-            timestamp=now,
+        assert signal_type == _DOCKET
+
+    @pytest.mark.parametrize(
+        "case", _URGENCY_CASES, ids=[case.title for case in _URGENCY_CASES]
+    )
+    def test_determine_urgency(
+        self, engine: SignalsRulesEngine, case: _UrgencyCase
+    ) -> None:
+        """Test urgency determination across signal types and keywords."""
+        signal = _make_signal(
+            source=case.source,
+            source_id="signal-1",
+            title=case.title,
+            deadline=(
+                (_NOW + case.deadline_delta).isoformat()
+                if case.deadline_delta is not None
+                else None
+            ),
+            metrics=(
+                {"comments_24h_delta_pct": case.surge_pct}
+                if case.surge_pct is not None
+                else {}
+            ),
+            signal_type=case.signal_type,
         )
-        signal.signal_type = SignalType.NOTICE
-        urgency = engine._determine_urgency(signal)
-        assert urgency == Urgency.MEDIUM  # Notice gets MEDIUM urgency
+        assert engine._determine_urgency(signal) == case.expected
 
-    def test_calculate_priority_score(self) -> None:
+    def test_calculate_priority_score(self, engine: SignalsRulesEngine) -> None:
         """Test priority score calculation."""
-        engine = SignalsRulesEngine()
         now = datetime.now(timezone.utc)
 
         # Final rule with high urgency
-        signal = SignalV2(
+        signal = _make_signal(
             source="federal_register",
             source_id="fr-1",
             title="Final Rule: Important",
-            link="https://example.com/fr-1",
             timestamp=now,
+            signal_type=_FINAL,
+            urgency=_U_HIGH,
+            watchlist_hit=True,
         )
-        signal.signal_type = SignalType.FINAL_RULE
-        signal.urgency = Urgency.HIGH
-        signal.watchlist_hit = True
 
         score = engine._calculate_priority_score(signal)
         # Base (1.0) * Final rule (5.0) * High urgency (1.5) + Watchlist (2.0) = 9.0
         assert score == 9.0
 
         # Bill with low urgency
-        signal = SignalV2(
-            source="congress",
+        signal = _make_signal(
             source_id="congress-1",
             title="Bill: New",
-            link="https://example.com/bill-1",
             timestamp=now,
+            signal_type=_BILL,
+            urgency=_U_LOW,
+            watchlist_hit=False,
         )
-        signal.signal_type = SignalType.BILL
-        signal.urgency = Urgency.LOW
-        signal.watchlist_hit = False
 
         score = engine._calculate_priority_score(signal)
         # Base (1.0) * Bill (1.5) * Low urgency (1.0) + Time boost = 3.0
         assert score == 3.0
 
-    def test_calculate_priority_score_with_modifiers(self) -> None:
+    def test_calculate_priority_score_with_modifiers(
+        self, engine: SignalsRulesEngine
+    ) -> None:
         """Test priority score calculation with various modifiers."""
-        engine = SignalsRulesEngine()
         now = datetime.now(timezone.utc)
 
         # Signal with comment surge and near deadline
-        signal = SignalV2(
+        signal = _make_signal(
             source="regulations_gov",
             source_id="docket-1",
             title="Docket: High Activity",
-            link="https://example.com/docket-1",
             timestamp=now,
-            deadline=(now + timedelta(days=2)).isoformat(),  # Near deadline
+            deadline=(now + _D2).isoformat(),  # Near deadline
             metrics={"comments_24h_delta_pct": 400.0},  # High surge
+            signal_type=_DOCKET,
+            urgency=_U_HIGH,
         )
-        signal.signal_type = SignalType.DOCKET
-        signal.urgency = Urgency.HIGH
 
         score = engine._calculate_priority_score(signal)
         # Base (1.0) * Docket (2.0) * High urgency (1.5) + Time boost = 4.5
         assert score == 4.5
 
-    def test_map_issue_codes_from_content(self) -> None:
+    @pytest.mark.parametrize(
+        "title,expected_codes",
+        [
+            ("Healthcare Bill", ["HCR"]),
+            ("Artificial Intelligence Technology Bill", ["TEC"]),
+            # Multiple issue codes
+            ("Healthcare Artificial Intelligence Technology Bill", ["HCR", "TEC"]),
+        ],
+    )
+    def test_map_issue_codes_from_content(
+        self, engine: SignalsRulesEngine, title: str, expected_codes: List[str]
+    ) -> None:
         """Test issue code mapping from content."""
-        engine = SignalsRulesEngine()
-
-        # Health content
-        signal = SignalV2(
-            source="congress",
+        signal = _make_signal(
             source_id="bill-1",
-            title="Healthcare Bill",
-            link="https://example.com/bill-1",
-            timestamp=datetime.now(timezone.utc),
+            title=title,
         )
         codes = engine._map_issue_codes(signal)
-        assert "HCR" in codes
-
-        # Tech content
-        signal.title = "Artificial Intelligence Technology Bill"
-        codes = engine._map_issue_codes(signal)
-        assert "TEC" in codes
-
-        # Multiple issue codes
-        signal.title = "Healthcare Artificial Intelligence Technology Bill"
-        codes = engine._map_issue_codes(signal)
-        assert "HCR" in codes
-        assert "TEC" in codes
-
-    def test_map_issue_codes_from_agency(self) -> None:
+        for code in expected_codes:
+            assert code in codes
+
+    @pytest.mark.parametrize(
+        "title,agency,expected_code",
+        [
+            ("HHS Rule", "HHS", "HCR"),
+            ("EPA Environmental Rule", "epa", "ENV"),
+            ("FCC Tech Rule", "fcc", "TEC"),
+        ],
+    )
+    def test_map_issue_codes_from_agency(
+        self, engine: SignalsRulesEngine, title: str, agency: str, expected_code: str
+    ) -> None:
         """Test issue code mapping from agency keywords."""
-        engine = SignalsRulesEngine()
-
-        # HHS agency
-        signal = SignalV2(
+        signal = _make_signal(
             source="federal_register",
             source_id="fr-1",
-            title="HHS Rule",
-            link="https://example.com/fr-1",
-            timestamp=datetime.now(timezone.utc),
-            agency="HHS",
+            title=title,
+            agency=agency,
         )
-        codes = engine._map_issue_codes(signal)
-        assert "HCR" in codes
-
-        # EPA agency
-        signal.title = "EPA Environmental Rule"
-        # No summary field in SignalV2
-        signal.agency = "epa"
-        codes = engine._map_issue_codes(signal)
-        assert "ENV" in codes
-
-        # FCC agency
-        signal.title = "FCC Tech Rule"
-        # No summary field in SignalV2
-        signal.agency = "fcc"
-        codes = engine._map_issue_codes(signal)
-        assert "TEC" in codes
-
-    def test_map_issue_codes_from_keywords(self) -> None:
+        assert expected_code in engine._map_issue_codes(signal)
+
+    @pytest.mark.parametrize(
+        "title,expected_code",
+        [
+            ("Data Privacy Protection Act", "TEC"),
+            ("Climate Change Mitigation", "ENV"),
+            ("Banking Reform", "FIN"),
+        ],
+    )
+    def test_map_issue_codes_from_keywords(
+        self, engine: SignalsRulesEngine, title: str, expected_code: str
+    ) -> None:
         """Test issue code mapping from content keywords."""
-        engine = SignalsRulesEngine()
-
-        # Privacy keyword
-        signal = SignalV2(
-            source="congress",
+        signal = _make_signal(
             source_id="bill-1",
-            title="Data Privacy Protection Act",
-            link="https://example.com/bill-1",
-            timestamp=datetime.now(timezone.utc),
+            title=title,
         )
-        codes = engine._map_issue_codes(signal)
-        assert "TEC" in codes
-
-        # Climate keyword
-        signal.title = "Climate Change Mitigation"
-        # No summary field in SignalV2
-        codes = engine._map_issue_codes(signal)
-        assert "ENV" in codes
+        assert expected_code in engine._map_issue_codes(signal)
 
-        # Banking keyword
-        signal.title = "Banking Reform"
-        # No summary field in SignalV2
-        codes = engine._map_issue_codes(signal)
-        assert "FIN" in codes
-
-    def test_map_issue_codes_default(self) -> None:
+    def test_map_issue_codes_default(self, engine: SignalsRulesEngine) -> None:
         """Test issue code mapping default fallback."""
-        engine = SignalsRulesEngine()
-
         # No matching issue codes, agencies, or keywords
-        signal = SignalV2(
-            source="congress",
+        signal = _make_signal(
             source_id="bill-1",
             title="General Government Bill",
-            link="https://example.com/bill-1",
-            timestamp=datetime.now(timezone.utc),
         )
         codes = engine._map_issue_codes(signal)
         assert codes == []  # No matches found
 
-    def test_check_watchlist_matches(self) -> None:
+    @pytest.mark.parametrize(
+        "title,agency,expected",
+        [
+            # Title match
+            ("Apple Privacy Bill", None, ["Apple", "privacy"]),
+            ("Tech Regulation", None, []),
+            # Agency match
+            ("General Bill", "Microsoft Compliance Office", ["Microsoft"]),
+            ("Data Protection", None, []),
+            ("Transportation Bill", "DOT", []),
+        ],
+    )
+    def test_check_watchlist_matches(
+        self, title: str, agency: Optional[str], expected: List[str]
+    ) -> None:
         """Test watchlist match detection."""
         watchlist = ["Apple", "Google", "Microsoft", "privacy"]
         engine = SignalsRulesEngine(watchlist)
 
-        # Title match
-        signal = SignalV2(
-            source="congress",
+        signal = _make_signal(
             source_id="bill-1",
-            title="Apple Privacy Bill",
-            link="https://example.com/bill-1",
-            timestamp=datetime.now(timezone.utc),
+            title=title,
+            agency=agency,
         )
-        matches = engine._check_watchlist_matches(signal)
-        assert "Apple" in matches
-        assert "privacy" in matches
-
-        # Tech Regulation
-        signal.title = "Tech Regulation"
-        # No summary field in SignalV2
-        matches = engine._check_watchlist_matches(signal)
-        assert len(matches) == 0  # No matches
+        assert engine._check_watchlist_matches(signal) == expected
 
-        # Agency match
-        signal.title = "General Bill"
-        # No summary field in SignalV2
-        signal.agency = "Microsoft Compliance Office"
-        matches = engine._check_watchlist_matches(signal)
-        assert "Microsoft" in matches
-
-        # Keyword match
-        signal.title = "Data Protection"
-        # No summary field in SignalV2
-        signal.agency = None
-        matches = engine._check_watchlist_matches(signal)
-        assert len(matches) == 0  # No matches
-
-        # No match
-        signal.title = "Transportation Bill"
-        # No summary field in SignalV2
-        signal.agency = "DOT"
-        matches = engine._check_watchlist_matches(signal)
-        assert len(matches) == 0  # No matches
-
-    def test_check_watchlist_matches_no_watchlist(self) -> None:
+    def test_check_watchlist_matches_no_watchlist(
+        self, engine: SignalsRulesEngine
+    ) -> None:
         """Test watchlist match detection with no watchlist."""
-        engine = SignalsRulesEngine()
-
-        signal = SignalV2(
-            source="congress",
+        signal = _make_signal(
             source_id="bill-1",
             title="Apple Privacy Bill",
-            link="https://example.com/bill-1",
-            timestamp=datetime.now(timezone.utc),
         )
         matches = engine._check_watchlist_matches(signal)
         assert matches == []
@@ -611,25 +512,20 @@ class TestSignalsRulesEngine:
         """Test complete signal processing workflow."""
         watchlist = ["Apple", "privacy"]
         engine = SignalsRulesEngine(watchlist)
-        now = datetime.now(timezone.utc)
 
-        signal = SignalV2(
+        signal = _make_signal(
             source="federal_register",
             source_id="fr-1",
             title="Final Rule: Apple Privacy Standards",
-            link="https://example.com/fr-1",
-            timestamp=now,
             issue_codes=["TEC"],
-            deadline=(now + timedelta(days=20)).isoformat(),
+            deadline=(_NOW + _D20).isoformat(),
         )
 
         processed_signal = engine.process_signal(signal)
 
         # Check all fields were processed
-        assert (
-            processed_signal.signal_type == SignalType.FINAL_RULE
-        )  # "Final Rule" in title
-        assert processed_signal.urgency == Urgency.HIGH  # Final rule gets HIGH urgency
+        assert processed_signal.signal_type == _FINAL  # "Final Rule" in title
+        assert processed_signal.urgency == _U_HIGH  # Final rule gets HIGH urgency
         assert processed_signal.priority_score > 0
         assert processed_signal.watchlist_matches == [
             "Apple",
@@ -645,23 +541,16 @@ class TestSignalDeduplicator:
     def test_deduplicate_signals_no_duplicates(self) -> None:
         """Test deduplication with no duplicates."""
         deduplicator = SignalDeduplicator()
-        now = datetime.now(timezone.utc)
 
         signals = [
-            SignalV2(
-                source="congress",
+            _make_signal(
                 source_id="bill-1",
                 title="Bill 1",
-                link="https://example.com/bill-1",
-                timestamp=now,
                 priority_score=5.0,
             ),
-            SignalV2(
-                source="congress",
+            _make_signal(
                 source_id="bill-2",
                 title="Bill 2",
-                link="https://example.com/bill-2",
-                timestamp=now,
                 priority_score=3.0,
             ),
         ]
@@ -674,73 +563,54 @@ class TestSignalDeduplicator:
     def test_deduplicate_signals_with_duplicates(self) -> None:
         """Test deduplication with duplicates."""
         deduplicator = SignalDeduplicator()
-        now = datetime.now(timezone.utc)
 
         signals = [
-            SignalV2(
-                source="congress",
+            _make_signal(
                 source_id="bill-1",
                 title="Bill 1",
-                link="https://example.com/bill-1",
-                timestamp=now,
                 priority_score=5.0,
             ),
-            SignalV2(
-                source="congress",
+            _make_signal(
                 source_id="bill-1",  # Duplicate stable_id
                 title="Bill 1 Updated",
-                link="https://example.com/bill-1",
-                timestamp=now,
                 priority_score=7.0,  # Higher priority
             ),
-            SignalV2(
-                source="congress",
+            _make_signal(
                 source_id="bill-2",
                 title="Bill 2",
-                link="https://example.com/bill-2",
-                timestamp=now,
                 priority_score=3.0,
             ),
         ]
 
         deduplicated = deduplicator.deduplicate(signals)
         assert len(deduplicated) == 2
-        # Should keep the first signal with the stable_id (not the higher priority one)
-        bill_1_signals = [s for s in deduplicated if s.stable_id == "congress:bill-1"]
-        assert len(bill_1_signals) == 1
-        assert bill_1_signals[0].priority_score == 5.0  # First signal
-        assert bill_1_signals[0].title == "Bill 1"
+        # Order is preserved, so the first signal with the stable_id (not the
+        # higher priority one) stays at the front
+        assert deduplicated[0].stable_id == "congress:bill-1"
+        assert deduplicated[0].priority_score == 5.0  # First signal
+        assert deduplicated[0].title == "Bill 1"
+        assert deduplicated[1].stable_id == "congress:bill-2"
 
     def test_calculate_similarity(self) -> None:
         """Test similarity calculation between signals."""
         deduplicator = SignalDeduplicator()
-        now = datetime.now(timezone.utc)
 
-        signal1 = SignalV2(
-            source="congress",
+        signal1 = _make_signal(
             source_id="bill-1",
             title="Privacy Protection Act",
-            link="https://example.com/bill-1",
-            timestamp=now,
         )
 
-        signal2 = SignalV2(
-            source="congress",
+        signal2 = _make_signal(
             source_id="bill-2",
             title="Privacy Protection Bill",
-            link="https://example.com/bill-2",
-            timestamp=now,
         )
 
         similarity = deduplicator._calculate_similarity(signal1, signal2)
         assert similarity >= 0.5  # Should have high similarity
 
-        signal3 = SignalV2(
-            source="congress",
+        signal3 = _make_signal(
             source_id="bill-3",
             title="Transportation Infrastructure",
-            link="https://example.com/bill-3",
-            timestamp=now,
         )
 
         similarity = deduplicator._calculate_similarity(signal1, signal3)
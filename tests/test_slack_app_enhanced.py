@@ -2,8 +2,25 @@
 
 import hashlib
 import hmac
+from typing import Callable, Iterator
+
+import pytest
 
 from bot import slack_app as slack_mod
+from tests.slack_stubs import CallRecorder
+
+# Keep the module-scoped SlackApp on one xdist worker
+pytestmark = pytest.mark.xdist_group("slack_app")
+
+# Signed request shared by the signature tests (secret "secret", now=1000)
+_BODY = b"payload"
+_TIMESTAMP = "995"
+_SIGNATURE = (
+    "v0="
+    + hmac.new(
+        b"secret", b"v0:" + _TIMESTAMP.encode() + b":" + _BODY, hashlib.sha256
+    ).hexdigest()
+)
 
 
 class DummyDB:
@@ -62,17 +79,97 @@ class DummyDigest:
         return f"{digest_type}-digest for {channel_id}"
 
 
-def _build_app(monkeypatch: object) -> slack_mod.SlackApp:
-    """Helper to create SlackApp with stubbed dependencies."""
-    monkeypatch.setattr(slack_mod, "MatchingService", DummyMatching)
-    monkeypatch.setattr(slack_mod, "EnhancedDigestComputer", DummyDigest)
-    return slack_mod.SlackApp(DummyDB())
+class DummyPermission:
+    """Permission manager that allows everything."""
+
+    def can_post_digest(self, channel_id: str, user_id: str) -> bool:  # noqa: ARG002
+        return True
+
+    def get_permission_error_message(self, *_: object) -> str:
+        return "nope"
+
+
+class BaseDummyLDA:
+    """LDAFrontPageDigest stand-in; subclasses add the method under test."""
+
+    def __init__(self, db_manager: object) -> None:  # noqa: ARG002
+        pass
+
+
+class DigestLDA(BaseDummyLDA):
+    """Returns a fixed digest body."""
+
+    def generate_digest(
+        self, channel_id: str, quarter: str | None = None
+    ) -> str:  # noqa: ARG002
+        return "lda digest"
+
+
+class TopClientsLDA(BaseDummyLDA):
+    """Returns two ranked clients."""
+
+    def get_top_clients(
+        self, quarter: str | None, limit: int
+    ) -> list[dict[str, object]]:  # noqa: ARG002
+        return [
+            {"name": "Client A", "total_amount": 1000, "filing_count": 2},
+            {"name": "Client B", "total_amount": 500, "filing_count": 1},
+        ]
+
+
+class EmptyIssuesLDA(BaseDummyLDA):
+    """Returns no issues."""
+
+    def get_issues_summary(
+        self, quarter: str | None
+    ) -> list[dict[str, object]]:  # noqa: ARG002
+        return []
+
+
+class EntityLDA(BaseDummyLDA):
+    """Returns a single client with one filing."""
+
+    def search_entity(self, name: str) -> dict[str, object]:  # noqa: ARG002
+        return {
+            "entity": {"name": "Acme", "type": "client"},
+            "total_amount": 123000,
+            "filing_count": 3,
+            "quarter": "2025Q1",
+            "filings": [
+                {"client_name": "Acme", "registrant_name": "Reg A", "amount": 1000}
+            ],
+        }
+
+
+@pytest.fixture(scope="module")
+def slack_app() -> Iterator[slack_mod.SlackApp]:
+    """SlackApp with stubbed dependencies, built once per module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(slack_mod, "MatchingService", DummyMatching)
+        mp.setattr(slack_mod, "EnhancedDigestComputer", DummyDigest)
+        mp.delenv("SLACK_BOT_TOKEN", raising=False)
+        mp.delenv("SLACK_SIGNING_SECRET", raising=False)
+        yield slack_mod.SlackApp(DummyDB())
+
 
+@pytest.fixture
+def app(slack_app: slack_mod.SlackApp) -> slack_mod.SlackApp:
+    """Shared SlackApp with per-test state reset.
 
-def test_watchlist_command_records_confirmation(monkeypatch: object) -> None:
+    Credentials are read once at construction, so tests that need a signing
+    secret set ``app.signing_secret`` through ``monkeypatch`` instead of env.
+    """
+    slack_app.pending_confirmations.clear()
+    slack_app.__dict__.pop("post_message", None)
+    slack_app.db_manager = DummyDB()
+    return slack_app
+
+
+def test_watchlist_command_records_confirmation(
+    app: slack_mod.SlackApp, monkeypatch: object
+) -> None:
     """Watchlist add should emit confirmation flow and cache the key."""
     monkeypatch.setattr(slack_mod.time, "time", lambda: 1700.0)
-    app = _build_app(monkeypatch)
 
     response = app.handle_slash_command(
         {
@@ -89,10 +186,31 @@ def test_watchlist_command_records_confirmation(monkeypatch: object) -> None:
     assert "Confirmation key" in response["text"]
 
 
-def test_handle_message_event_processes_confirmation(monkeypatch: object) -> None:
+def test_expired_confirmations_evicted_on_insert(
+    app: slack_mod.SlackApp, monkeypatch: object
+) -> None:
+    """Adding a confirmation should evict ones older than the TTL."""
+    command = {
+        "command": "/watchlist",
+        "text": "add MegaCorp",
+        "channel_id": "C1",
+        "user_id": "U1",
+    }
+    monkeypatch.setattr(slack_mod.time, "time", lambda: 1000.0)
+    app.handle_slash_command(command)
+
+    later = 1000.0 + slack_mod.CONFIRMATION_TTL_SECONDS + 1
+    monkeypatch.setattr(slack_mod.time, "time", lambda: later)
+    app.handle_slash_command(command)
+
+    assert list(app.pending_confirmations) == [f"C1:U1:{int(later)}"]
+
+
+def test_handle_message_event_processes_confirmation(
+    app: slack_mod.SlackApp, monkeypatch: object, post_recorder: CallRecorder
+) -> None:
     """Confirmation messages should be routed to the matching service."""
     monkeypatch.setattr(slack_mod.time, "time", lambda: 2000.0)
-    app = _build_app(monkeypatch)
     key = "C9:U9:2000"
     app.pending_confirmations[key] = {
         "search_term": "Acme",
@@ -102,32 +220,22 @@ def test_handle_message_event_processes_confirmation(monkeypatch: object) -> Non
         "timestamp": 1950.0,
     }
 
-    posted: list[tuple[str, str]] = []
-    app.post_message = lambda channel, text, thread_ts=None: posted.append(
-        (channel, text)
-    ) or {  # type: ignore[assignment]
-        "ok": True
-    }
+    app.post_message = post_recorder  # type: ignore[method-assign]
 
     result = app.handle_message_event(
         {"type": "message", "text": f"1 {key}", "channel": "C9", "user": "U9"}
     )
 
     assert result == {"status": "success", "message": "added"}
-    assert posted == [("C9", "added")]
+    assert post_recorder.calls == [("C9", "added")]
     assert key not in app.pending_confirmations
 
 
-def test_lobbypulse_command_posts_digest(monkeypatch: object) -> None:
+def test_lobbypulse_command_posts_digest(
+    app: slack_mod.SlackApp, post_recorder: CallRecorder
+) -> None:
     """Manual digest command should trigger posting via Slack API wrapper."""
-    app = _build_app(monkeypatch)
-
-    posted: list[tuple[str, str]] = []
-    app.post_message = lambda channel, text, thread_ts=None: posted.append(
-        (channel, text)
-    ) or {  # type: ignore[assignment]
-        "ok": True
-    }
+    app.post_message = post_recorder  # type: ignore[method-assign]
 
     response = app.handle_slash_command(
         {
@@ -139,82 +247,77 @@ def test_lobbypulse_command_posts_digest(monkeypatch: object) -> None:
     )
 
     assert response["response_type"] == "in_channel"
-    assert posted == [("C55", "mini-digest for C55")]
+    assert post_recorder.calls == [("C55", "mini-digest for C55")]
 
 
-def test_verify_slack_request_dev_mode_without_secret(monkeypatch: object) -> None:
+def test_verify_slack_request_dev_mode_without_secret(
+    app: slack_mod.SlackApp,
+) -> None:
     """Missing signing secret in dev should skip verification."""
-    monkeypatch.delenv("SLACK_SIGNING_SECRET", raising=False)
-    app = _build_app(monkeypatch)
-
     assert app.verify_slack_request({}, "body") is True
 
 
-def test_verify_slack_request_valid_signature(monkeypatch: object) -> None:
+def test_verify_slack_request_valid_signature(
+    app: slack_mod.SlackApp, monkeypatch: object
+) -> None:
     """Valid signature should pass verification when secret is set."""
-    monkeypatch.setenv("SLACK_SIGNING_SECRET", "secret")
+    monkeypatch.setattr(app, "signing_secret", "secret")
     monkeypatch.setattr(slack_mod.time, "time", lambda: 1000.0)
-    app = _build_app(monkeypatch)
 
-    body = "payload"
-    timestamp = "995"
-    sig_basestring = f"v0:{timestamp}:{body}"
-    signature = (
-        "v0=" + hmac.new(b"secret", sig_basestring.encode(), hashlib.sha256).hexdigest()
-    )
+    headers = {"X-Slack-Request-Timestamp": _TIMESTAMP, "X-Slack-Signature": _SIGNATURE}
+
+    assert app.verify_slack_request(headers, _BODY)
+    # Decoded bodies are still accepted
+    assert app.verify_slack_request(headers, _BODY.decode())
+
 
-    assert app.verify_slack_request(
-        {"X-Slack-Request-Timestamp": timestamp, "X-Slack-Signature": signature},
-        body,
+def test_verify_slack_request_wrong_signature_constant_time(
+    app: slack_mod.SlackApp, monkeypatch: object
+) -> None:
+    """A signature differing only in its last hex digit should be rejected."""
+    monkeypatch.setattr(app, "signing_secret", "secret")
+    monkeypatch.setattr(slack_mod.time, "time", lambda: 1000.0)
+
+    tampered = _SIGNATURE[:-1] + ("0" if _SIGNATURE[-1] != "0" else "1")
+
+    assert (
+        app.verify_slack_request(
+            {"X-Slack-Request-Timestamp": _TIMESTAMP, "X-Slack-Signature": tampered},
+            _BODY,
+        )
+        is False
+    )
+    # Non-ASCII header values are rejected rather than raising TypeError
+    assert (
+        app.verify_slack_request(
+            {"X-Slack-Request-Timestamp": _TIMESTAMP, "X-Slack-Signature": "v0=é"},
+            _BODY,
+        )
+        is False
     )
 
 
-def test_verify_slack_request_missing_signature(monkeypatch: object) -> None:
+def test_verify_slack_request_missing_signature(
+    app: slack_mod.SlackApp, monkeypatch: object
+) -> None:
     """Missing signature headers should fail verification when secret exists."""
-    monkeypatch.setenv("SLACK_SIGNING_SECRET", "secret")
-    app = _build_app(monkeypatch)
+    monkeypatch.setattr(app, "signing_secret", "secret")
 
     assert app.verify_slack_request({"X-Slack-Request-Timestamp": "1"}, "x") is False
 
 
-def test_lobbylens_lda_digest_posts(monkeypatch: object) -> None:
+def test_lobbylens_lda_digest_posts(
+    app: slack_mod.SlackApp,
+    monkeypatch: object,
+    lda_stub: Callable[..., None],
+    post_recorder: CallRecorder,
+) -> None:
     """LDA digest subcommand should post digest content."""
-    monkeypatch.setenv(
-        "SLACK_SIGNING_SECRET", "secret"
-    )  # ensure production branch not used
-    monkeypatch.setattr("bot.utils.is_lda_enabled", lambda: True)
-
-    class DummyPermission:
-        def can_post_digest(
-            self, channel_id: str, user_id: str
-        ) -> bool:  # noqa: ARG002
-            return True
-
-        def get_permission_error_message(self, *_: object) -> str:
-            return "nope"
-
-    class DummyLDA:
-        def __init__(self, db_manager: object) -> None:  # noqa: ARG002
-            pass
-
-        def generate_digest(
-            self, channel_id: str, quarter: str | None = None
-        ) -> str:  # noqa: ARG002
-            return "lda digest"
-
-    posted: list[tuple[str, str]] = []
-
-    monkeypatch.setattr("bot.lda_front_page_digest.LDAFrontPageDigest", DummyLDA)
-    monkeypatch.setattr(
-        "bot.permissions.get_permission_manager", lambda: DummyPermission()
-    )
+    # ensure production branch not used
+    monkeypatch.setattr(app, "signing_secret", "secret")
+    lda_stub(DigestLDA, permission_manager=DummyPermission())
 
-    app = _build_app(monkeypatch)
-    app.post_message = lambda channel, text, thread_ts=None: posted.append(
-        (channel, text)
-    ) or {  # type: ignore[assignment]
-        "ok": True
-    }
+    app.post_message = post_recorder  # type: ignore[method-assign]
 
     response = app.handle_slash_command(
         {
@@ -226,29 +329,15 @@ def test_lobbylens_lda_digest_posts(monkeypatch: object) -> None:
     )
 
     assert response["response_type"] == "ephemeral"
-    assert posted == [("C123", "lda digest")]
+    assert post_recorder.calls == [("C123", "lda digest")]
 
 
-def test_lobbylens_lda_top_clients(monkeypatch: object) -> None:
+def test_lobbylens_lda_top_clients(
+    app: slack_mod.SlackApp, lda_stub: Callable[..., None]
+) -> None:
     """Top clients command should format ranking."""
-    monkeypatch.setattr("bot.utils.is_lda_enabled", lambda: True)
-
-    class DummyLDA:
-        def __init__(self, db_manager: object) -> None:  # noqa: ARG002
-            pass
-
-        def get_top_clients(
-            self, quarter: str | None, limit: int
-        ) -> list[dict[str, object]]:  # noqa: ARG002
-            return [
-                {"name": "Client A", "total_amount": 1000, "filing_count": 2},
-                {"name": "Client B", "total_amount": 500, "filing_count": 1},
-            ]
+    lda_stub(TopClientsLDA)
 
-    monkeypatch.setattr("bot.lda_front_page_digest.LDAFrontPageDigest", DummyLDA)
-    monkeypatch.setattr("bot.permissions.get_permission_manager", lambda: object())
-
-    app = _build_app(monkeypatch)
     response = app.handle_slash_command(
         {
             "command": "/lobbylens",
@@ -262,23 +351,12 @@ def test_lobbylens_lda_top_clients(monkeypatch: object) -> None:
     assert "Client A" in response["text"]
 
 
-def test_lobbylens_lda_issues_empty(monkeypatch: object) -> None:
+def test_lobbylens_lda_issues_empty(
+    app: slack_mod.SlackApp, lda_stub: Callable[..., None]
+) -> None:
     """Issues command should handle empty result set."""
-    monkeypatch.setattr("bot.utils.is_lda_enabled", lambda: True)
-
-    class DummyLDA:
-        def __init__(self, db_manager: object) -> None:  # noqa: ARG002
-            pass
-
-        def get_issues_summary(
-            self, quarter: str | None
-        ) -> list[dict[str, object]]:  # noqa: ARG002
-            return []
-
-    monkeypatch.setattr("bot.lda_front_page_digest.LDAFrontPageDigest", DummyLDA)
-    monkeypatch.setattr("bot.permissions.get_permission_manager", lambda: object())
+    lda_stub(EmptyIssuesLDA)
 
-    app = _build_app(monkeypatch)
     response = app.handle_slash_command(
         {
             "command": "/lobbylens",
@@ -291,29 +369,12 @@ def test_lobbylens_lda_issues_empty(monkeypatch: object) -> None:
     assert "No issues" in response["text"]
 
 
-def test_lobbylens_lda_entity(monkeypatch: object) -> None:
+def test_lobbylens_lda_entity(
+    app: slack_mod.SlackApp, lda_stub: Callable[..., None]
+) -> None:
     """Entity search should format entity details."""
-    monkeypatch.setattr("bot.utils.is_lda_enabled", lambda: True)
-
-    class DummyLDA:
-        def __init__(self, db_manager: object) -> None:  # noqa: ARG002
-            pass
-
-        def search_entity(self, name: str) -> dict[str, object]:  # noqa: ARG002
-            return {
-                "entity": {"name": "Acme", "type": "client"},
-                "total_amount": 123000,
-                "filing_count": 3,
-                "quarter": "2025Q1",
-                "filings": [
-                    {"client_name": "Acme", "registrant_name": "Reg A", "amount": 1000}
-                ],
-            }
-
-    monkeypatch.setattr("bot.lda_front_page_digest.LDAFrontPageDigest", DummyLDA)
-    monkeypatch.setattr("bot.permissions.get_permission_manager", lambda: object())
-
-    app = _build_app(monkeypatch)
+    lda_stub(EntityLDA)
+
     response = app.handle_slash_command(
         {
             "command": "/lobbylens",
@@ -327,18 +388,12 @@ def test_lobbylens_lda_entity(monkeypatch: object) -> None:
     assert "Quarter" in response["text"]
 
 
-def test_lobbylens_lda_watchlist_list(monkeypatch: object) -> None:
+def test_lobbylens_lda_watchlist_list(
+    app: slack_mod.SlackApp, lda_stub: Callable[..., None]
+) -> None:
     """Watchlist list should enumerate items when present."""
-    monkeypatch.setattr("bot.utils.is_lda_enabled", lambda: True)
-
-    class DummyLDA:
-        def __init__(self, db_manager: object) -> None:  # noqa: ARG002
-            pass
-
-    monkeypatch.setattr("bot.lda_front_page_digest.LDAFrontPageDigest", DummyLDA)
-    monkeypatch.setattr("bot.permissions.get_permission_manager", lambda: object())
+    lda_stub(BaseDummyLDA)
 
-    app = _build_app(monkeypatch)
     app.db_manager.watchlist = [
         {"display_name": "Acme", "entity_type": "client"},
         {"display_name": "Reg A", "entity_type": "registrant"},
@@ -4,238 +4,276 @@ End-to-end tests for V2 path: collect signals → format digest → send via not
 These tests exercise the full V2 pipeline with mocked external dependencies.
 """
 
+import contextlib
+import socket
 from datetime import datetime, timezone
-from typing import Any
-from unittest.mock import Mock, patch
+from email import message_from_bytes
+from email.message import Message
+from types import MappingProxyType
+from typing import Any, Iterator, NamedTuple, Optional
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from bot.daily_signals import DailySignalsCollector
-from bot.digest import DigestFormatter
 from bot.notifiers.email import EmailNotifier
-from bot.run import run_daily_digest, run_mini_digest
 from bot.signals import SignalV2
 
+# bot.run (click, rich, the digest formatter) and aiosmtpd are imported where
+# they are used; nothing in conftest loads them, so collecting this module
+# (e.g. under -k) stays cheap.
+
+_NOW = datetime.now(timezone.utc)
+_DAILY_DIGEST_TEXT = "📋 **Daily Digest**\n\n• Privacy Regulation Update"
+
+# Fields shared by most e2e signals; each signal lists only what differs
+_BASE_SIGNAL_KWARGS = MappingProxyType(
+    {
+        "source": "federal_register",
+        "source_id": "FR-2024-00123",
+        "timestamp": _NOW,
+        "link": "https://example.com",
+    }
+)
+
+
+def _make_signal(**overrides: Any) -> SignalV2:
+    """Build a SignalV2 from the shared base fields plus overrides."""
+    return SignalV2(**{**_BASE_SIGNAL_KWARGS, **overrides})
+
+
+_PRIVACY_RULE = _make_signal(
+    title="Privacy Regulation Update",
+    link="https://federalregister.gov/d/2024-00123",
+    agency="Federal Trade Commission",
+    issue_codes=["TEC", "HCR"],
+    priority_score=6.5,
+    watchlist_hit=True,
+)
+_PRIVACY_BILL = _make_signal(
+    source="congress",
+    source_id="HR-1234",
+    title="Data Privacy Act of 2024",
+    link="https://congress.gov/bill/118/hr1234",
+    bill_id="HR-1234",
+    issue_codes=["TEC"],
+    priority_score=5.2,
+)
+_HIGH_PRIORITY_RULE = _make_signal(
+    title="High Priority Rule", priority_score=6.0  # Above threshold
+)
+_WATCHLIST_BILL = _make_signal(
+    source="congress", source_id="HR-1234", title="Watchlist Match", watchlist_hit=True
+)
+_LOW_PRIORITY_NOTICE = _make_signal(
+    title="Low Priority Notice", priority_score=2.0  # Below threshold
+)
+_WATCHLIST_RULE = _make_signal(
+    title="Google Privacy Policy Update", watchlist_hit=True, priority_score=7.0
+)
+
+
+class _DigestCase(NamedTuple):
+    run: str  # name of the bot.run entry point
+    hours_back: int
+    signals: tuple[SignalV2, ...]
+    format_method: str
+    formatted: str
+    expected: Optional[str]
+
+
+_DIGEST_CASES = {
+    "daily": _DigestCase(
+        "run_daily_digest",
+        24,
+        (_PRIVACY_RULE, _PRIVACY_BILL),
+        "format_daily_digest",
+        _DAILY_DIGEST_TEXT,
+        _DAILY_DIGEST_TEXT,
+    ),
+    "mini_threshold_met": _DigestCase(
+        "run_mini_digest",
+        4,
+        (_HIGH_PRIORITY_RULE, _WATCHLIST_BILL),
+        "format_mini_digest",
+        "⚡ Mini Digest",
+        "⚡ Mini Digest",
+    ),
+    "mini_threshold_not_met": _DigestCase(
+        "run_mini_digest",
+        4,
+        (_LOW_PRIORITY_NOTICE,),
+        "format_mini_digest",
+        "⚡ Mini Digest",
+        None,
+    ),
+    "daily_watchlist_hit": _DigestCase(
+        "run_daily_digest",
+        24,
+        (_WATCHLIST_RULE,),
+        "format_daily_digest",
+        "📋 Digest with watchlist",
+        "📋 Digest with watchlist",
+    ),
+}
+
+
+_SMTP_BIND_ATTEMPTS = 5
+# A failed bind only surfaces after ready_timeout (aiosmtpd default: 5 s)
+_SMTP_READY_TIMEOUT = 1.0
+
+
+class _Inbox:
+    """aiosmtpd handler that keeps every delivered message in memory."""
+
+    def __init__(self) -> None:
+        self.messages: list[Message] = []
+
+    async def handle_DATA(self, server: Any, session: Any, envelope: Any) -> str:
+        self.messages.append(message_from_bytes(envelope.content))
+        return "250 Message accepted for delivery"
+
+
+@pytest.fixture(scope="module")
+def smtp_sink() -> Iterator[tuple[str, int, list[Message]]]:
+    """Run one loopback SMTP server for the module; yield host, port, inbox."""
+    from aiosmtpd.controller import Controller
+
+    # Controller cannot bind port 0 itself, so probe for a free port. Another
+    # xdist worker can grab it between the probe and the bind; retry if so.
+    inbox = _Inbox()
+    for attempt in range(_SMTP_BIND_ATTEMPTS):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+
+        controller = Controller(
+            inbox,
+            hostname="127.0.0.1",
+            port=port,
+            ready_timeout=_SMTP_READY_TIMEOUT,
+        )
+        try:
+            controller.start()
+        except OSError:
+            controller.loop.close()
+            if attempt == _SMTP_BIND_ATTEMPTS - 1:
+                raise
+        else:
+            break
+
+    try:
+        yield controller.hostname, port, inbox.messages
+    finally:
+        controller.stop()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_pipeline() -> Iterator[tuple[MagicMock, MagicMock]]:
+    """Patch the collector and formatter classes once for the module.
+
+    ``spec_set`` also specs the instances, so calls to methods the real
+    classes no longer have fail instead of passing silently.
+    """
+    with contextlib.ExitStack() as stack:
+        yield (
+            stack.enter_context(
+                patch("bot.daily_signals.DailySignalsCollector", spec_set=True)
+            ),
+            stack.enter_context(patch("bot.digest.DigestFormatter", spec_set=True)),
+        )
+
+
+@pytest.fixture
+def pipeline_mocks(
+    _patch_pipeline: tuple[MagicMock, MagicMock]
+) -> tuple[MagicMock, MagicMock]:
+    """Reset the module-wide patches and return fresh pipeline mocks."""
+    instances = []
+    for mock_class in _patch_pipeline:
+        # Keep the specced instance; only clear what earlier tests configured
+        mock_class.reset_mock()
+        mock_class.return_value.reset_mock(return_value=True, side_effect=True)
+        instances.append(mock_class.return_value)
+    collector, formatter = instances
+    return collector, formatter
 
+
+@pytest.fixture(scope="module")
+def mock_signals() -> list[SignalV2]:
+    """Create mock signals once per module; tests only read them."""
+    return [_PRIVACY_RULE, _PRIVACY_BILL]
+
+
+@pytest.mark.xdist_group("e2e")
 class TestV2EndToEnd:
     """End-to-end tests for V2 digest pipeline."""
 
-    @pytest.fixture
-    def mock_signals(self) -> list[SignalV2]:
-        """Create mock signals for testing."""
-        return [
-            SignalV2(
-                source="federal_register",
-                source_id="FR-2024-00123",
-                timestamp=datetime.now(timezone.utc),
-                title="Privacy Regulation Update",
-                link="https://federalregister.gov/d/2024-00123",
-                agency="Federal Trade Commission",
-                issue_codes=["TEC", "HCR"],
-                priority_score=6.5,
-                watchlist_hit=True,
-            ),
-            SignalV2(
-                source="congress",
-                source_id="HR-1234",
-                timestamp=datetime.now(timezone.utc),
-                title="Data Privacy Act of 2024",
-                link="https://congress.gov/bill/118/hr1234",
-                bill_id="HR-1234",
-                issue_codes=["TEC"],
-                priority_score=5.2,
-            ),
-        ]
-
-    @patch("bot.daily_signals.DailySignalsCollector")
-    @patch("bot.digest.DigestFormatter")
-    def test_e2e_daily_digest_with_email(
-        self,
-        mock_formatter_class: Any,
-        mock_collector_class: Any,
-        mock_signals: list[SignalV2],
+    @pytest.mark.parametrize(
+        "case",
+        [
+            # "daily" asserts the same call contract as "daily_watchlist_hit"
+            pytest.param(
+                case, id=name, marks=pytest.mark.slow if name == "daily" else ()
+            )
+            for name, case in _DIGEST_CASES.items()
+        ],
+    )
+    def test_run_digest(
+        self, pipeline_mocks: tuple[MagicMock, MagicMock], case: _DigestCase
     ) -> None:
-        """Test full V2 pipeline: collect → format → send via email."""
-        # Setup mocks
-        mock_collector = Mock()
-        mock_formatter = Mock()
-
-        mock_collector_class.return_value = mock_collector
-        mock_formatter_class.return_value = mock_formatter
-
-        # Configure mock returns
-        mock_collector.collect_signals.return_value = mock_signals
-        mock_digest_text = "📋 **Daily Digest**\n\n• Privacy Regulation Update"
-        mock_formatter.format_daily_digest.return_value = mock_digest_text
-
-        # Run the pipeline
-        result = run_daily_digest(hours_back=24, channel_id="test_channel")
-
-        # Verify pipeline steps
-        mock_collector_class.assert_called_once()
-        mock_collector.collect_signals.assert_called_once_with(24)
-        mock_formatter_class.assert_called_once()
-        mock_formatter.format_daily_digest.assert_called_once_with(mock_signals, 24)
-
-        # Result should be the formatted digest
-        assert result == mock_digest_text
-
-    @patch("bot.daily_signals.DailySignalsCollector")
-    @patch("bot.digest.DigestFormatter")
-    @patch("smtplib.SMTP")
+        """Collected signals reach the formatter only when a digest is due."""
+        from bot import run
+
+        collector, formatter = pipeline_mocks
+        signals = list(case.signals)
+        collector.collect_signals.return_value = signals
+        format_digest = getattr(formatter, case.format_method)
+        format_digest.return_value = case.formatted
+
+        run_digest = getattr(run, case.run)
+        result = run_digest(hours_back=case.hours_back, channel_id="test_channel")
+
+        assert result == case.expected
+        collector.collect_signals.assert_called_once_with(case.hours_back)
+        if case.expected is None:
+            format_digest.assert_not_called()
+        else:
+            format_digest.assert_called_once()
+            assert format_digest.call_args[0][0] == signals
+
     def test_e2e_daily_digest_email_send(
         self,
-        mock_smtp_class: Any,
-        mock_formatter_class: Any,
-        mock_collector_class: Any,
+        pipeline_mocks: tuple[MagicMock, MagicMock],
         mock_signals: list[SignalV2],
+        smtp_sink: tuple[str, int, list[Message]],
     ) -> None:
-        """Test that email notifier is called with correct payload."""
-        # Setup mocks
-        mock_collector = Mock()
-        mock_formatter = Mock()
-        mock_smtp_ctx = Mock()
-        mock_smtp_class.return_value.__enter__.return_value = mock_smtp_ctx
+        """Test that the digest is delivered over SMTP with the right payload."""
+        from bot.run import run_daily_digest
 
-        mock_collector_class.return_value = mock_collector
-        mock_formatter_class.return_value = mock_formatter
+        collector, formatter = pipeline_mocks
+        host, port, inbox = smtp_sink
+        inbox.clear()
 
-        mock_collector.collect_signals.return_value = mock_signals
-        mock_digest_text = "📋 **Daily Digest**\n\n• Privacy Regulation Update"
-        mock_formatter.format_daily_digest.return_value = mock_digest_text
+        collector.collect_signals.return_value = mock_signals
+        formatter.format_daily_digest.return_value = _DAILY_DIGEST_TEXT
 
         # Generate digest
         digest = run_daily_digest(hours_back=24, channel_id="test_channel")
 
         # Send via email (simulating what main() would do)
+        # The loopback sink has no STARTTLS; TLS is covered by the notifier tests
         notifier = EmailNotifier(
-            host="smtp.example.com",
-            port=587,
+            host=host,
+            port=port,
             from_address="bot@example.com",
             to_addresses=["user@example.com"],
-            use_tls=True,
+            use_tls=False,
         )
         notifier.send(digest, subject="Daily Digest")
 
-        # Verify email was sent
-        mock_smtp_ctx.starttls.assert_called_once()
-        mock_smtp_ctx.send_message.assert_called_once()
-
-        # Verify email content
-        sent_msg = mock_smtp_ctx.send_message.call_args[0][0]
+        # Verify exactly one email arrived with the digest as its body
+        assert len(inbox) == 1
+        sent_msg = inbox[0]
         assert "Daily Digest" in sent_msg["Subject"]
-        assert digest in sent_msg.get_payload()
-
-    @patch("bot.daily_signals.DailySignalsCollector")
-    @patch("bot.digest.DigestFormatter")
-    def test_e2e_mini_digest_threshold_met(
-        self,
-        mock_formatter_class: Any,
-        mock_collector_class: Any,
-        mock_signals: list[SignalV2],
-    ) -> None:
-        """Test mini digest when thresholds are met."""
-        mock_collector = Mock()
-        mock_formatter = Mock()
-
-        mock_collector_class.return_value = mock_collector
-        mock_formatter_class.return_value = mock_formatter
-
-        # Create signals that meet mini-digest thresholds
-        high_priority_signal = SignalV2(
-            source="federal_register",
-            source_id="FR-2024-00123",
-            timestamp=datetime.now(timezone.utc),
-            title="High Priority Rule",
-            link="https://example.com",
-            priority_score=6.0,  # Above threshold
-        )
-        watchlist_signal = SignalV2(
-            source="congress",
-            source_id="HR-1234",
-            timestamp=datetime.now(timezone.utc),
-            title="Watchlist Match",
-            link="https://example.com",
-            watchlist_hit=True,
-        )
-
-        mock_collector.collect_signals.return_value = [
-            high_priority_signal,
-            watchlist_signal,
-        ]
-        mock_formatter.format_mini_digest.return_value = "⚡ Mini Digest"
-
-        result = run_mini_digest(hours_back=4, channel_id="test_channel")
-
-        assert result == "⚡ Mini Digest"
-        mock_formatter.format_mini_digest.assert_called_once()
-
-    @patch("bot.daily_signals.DailySignalsCollector")
-    @patch("bot.digest.DigestFormatter")
-    def test_e2e_mini_digest_threshold_not_met(
-        self,
-        mock_formatter_class: Any,
-        mock_collector_class: Any,
-    ) -> None:
-        """Test mini digest when thresholds are not met."""
-        mock_collector = Mock()
-        mock_formatter = Mock()
-
-        mock_collector_class.return_value = mock_collector
-        mock_formatter_class.return_value = mock_formatter
-
-        # Create signals that don't meet thresholds
-        low_priority_signals = [
-            SignalV2(
-                source="federal_register",
-                source_id="FR-2024-00123",
-                timestamp=datetime.now(timezone.utc),
-                title="Low Priority Notice",
-                link="https://example.com",
-                priority_score=2.0,  # Below threshold
-            )
-        ]
-
-        mock_collector.collect_signals.return_value = low_priority_signals
-
-        result = run_mini_digest(hours_back=4, channel_id="test_channel")
-
-        assert result is None
-        mock_formatter.format_mini_digest.assert_not_called()
-
-    @patch("bot.daily_signals.DailySignalsCollector")
-    @patch("bot.digest.DigestFormatter")
-    def test_e2e_digest_with_watchlist_hits(
-        self,
-        mock_formatter_class: Any,
-        mock_collector_class: Any,
-        mock_signals: list[SignalV2],
-    ) -> None:
-        """Test digest generation includes watchlist hits."""
-        mock_collector = Mock()
-        mock_formatter = Mock()
-
-        mock_collector_class.return_value = mock_collector
-        mock_formatter_class.return_value = mock_formatter
-
-        # Signal with watchlist hit
-        watchlist_signal = SignalV2(
-            source="federal_register",
-            source_id="FR-2024-00123",
-            timestamp=datetime.now(timezone.utc),
-            title="Google Privacy Policy Update",
-            link="https://example.com",
-            watchlist_hit=True,
-            priority_score=7.0,
-        )
-
-        mock_collector.collect_signals.return_value = [watchlist_signal]
-        mock_formatter.format_daily_digest.return_value = "📋 Digest with watchlist"
-
-        result = run_daily_digest(hours_back=24, channel_id="test_channel")
-
-        assert result == "📋 Digest with watchlist"
-        # Verify watchlist signal was passed to formatter
-        call_args = mock_formatter.format_daily_digest.call_args[0]
-        assert len(call_args[0]) == 1
-        assert call_args[0][0].watchlist_hit is True
+        body = sent_msg.get_payload(decode=True).decode()
+        assert body.splitlines() == digest.splitlines()
@@ -1,79 +1,109 @@
 """Tests for web_server slash command handling with mocked dependencies."""
 
-from unittest.mock import patch
+from typing import Iterator
+from urllib.parse import urlencode
 
 import pytest
 
-from bot.web_server import create_web_server
-from tests.slack_stubs import StubSlackApp
+from bot import config
+from tests.slack_stubs import FakeSignalsDB
 
+_FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
 
-@pytest.fixture(autouse=True)
-def _disable_signature_check(monkeypatch: object) -> None:
-    """Skip Slack signature verification in legacy command tests."""
-    from bot import config
-
-    monkeypatch.setattr(config.settings, "slack_signing_secret", None)
-
-
-@pytest.fixture
-def slack_stub() -> StubSlackApp:
-    return StubSlackApp()
-
-
-@pytest.fixture
-def app(slack_stub: StubSlackApp) -> object:
-    application = create_web_server(slack_app=slack_stub)
-    application.config["TESTING"] = True
-    return application
+# Slash command forms, URL-encoded once at import
+_CMD_FORMS = {
+    name: urlencode({"command": command, "text": text, "channel_id": "ch"}).encode()
+    for name, (command, text) in {
+        "lobbypulse": ("/lobbypulse", ""),
+        "lobbypulse_mini": ("/lobbypulse", "mini"),
+        "threshold_show": ("/threshold", ""),
+        "threshold_set": ("/threshold", "set 10"),
+        "watchlist_invalid": ("/watchlist", "invalid"),
+        "unknown": ("/unknown", ""),
+    }.items()
+}
 
 
-@pytest.fixture
-def client(app: object) -> object:
-    return app.test_client()
+@pytest.fixture(scope="module", autouse=True)
+def _disable_signature_check() -> Iterator[None]:
+    """Skip Slack signature verification in legacy command tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(config.settings, "slack_signing_secret", None)
+        yield
 
 
-@patch("bot.web_server.run_daily_digest", return_value="digest")
-@patch("bot.web_server.create_signals_database")
-def test_lobbypulse_command(mock_db: object, mock_run: object, client: object) -> None:
-    mock_db.return_value = None  # not used in handler
-    resp = client.post(
+def test_lobbypulse_command(
+    web_client: object, fake_db: FakeSignalsDB, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("bot.web_server.run_daily_digest", lambda *_: "digest")
+    resp = web_client.post(
         "/lobbylens/commands",
-        data={"command": "/lobbypulse", "text": "", "channel_id": "ch"},
+        data=_CMD_FORMS["lobbypulse"],
+        content_type=_FORM_CONTENT_TYPE,
     )
     assert resp.status_code == 200
     data = resp.get_json()
     assert data["response_type"] == "in_channel"
-    assert "digest" in data["text"]
+    assert data["text"] == "digest"
 
 
-@patch("bot.web_server.run_mini_digest", return_value="mini-digest")
-@patch("bot.web_server.create_signals_database")
 def test_lobbypulse_mini_command(
-    mock_db: object, mock_run: object, client: object
+    web_client: object, fake_db: FakeSignalsDB, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    mock_db.return_value = None
-    resp = client.post(
+    monkeypatch.setattr("bot.web_server.run_mini_digest", lambda *_: "mini-digest")
+    resp = web_client.post(
         "/lobbylens/commands",
-        data={"command": "/lobbypulse", "text": "mini", "channel_id": "ch"},
+        data=_CMD_FORMS["lobbypulse_mini"],
+        content_type=_FORM_CONTENT_TYPE,
     )
     assert resp.status_code == 200
     assert resp.get_json()["text"] == "mini-digest"
 
 
-@patch("bot.web_server.create_signals_database")
-def test_threshold_show_settings(mock_db: object, client: object) -> None:
-    # Mock DB with simple settings
-    mock_db.return_value.get_channel_settings.return_value = {
+def test_threshold_show_settings(web_client: object, fake_db: FakeSignalsDB) -> None:
+    # Fake DB with simple settings
+    fake_db.channel_settings = {
         "mini_digest_threshold": 5,
         "high_priority_threshold": 2.0,
         "surge_threshold": 100.0,
     }
-    resp = client.post(
+    resp = web_client.post(
         "/lobbylens/commands",
-        data={"command": "/threshold", "text": "", "channel_id": "ch"},
+        data=_CMD_FORMS["threshold_show"],
+        content_type=_FORM_CONTENT_TYPE,
     )
     assert resp.status_code == 200
     data = resp.get_json()
-    assert "Threshold Settings" in data["text"]
-    assert "5" in data["text"]
+    assert data["text"].startswith("📊 **Threshold Settings for #ch**")
+    assert "• Mini-digest threshold: 5 signals" in data["text"]
+
+
+def test_watchlist_invalid_usage(web_client: object, fake_db: FakeSignalsDB) -> None:
+    resp = web_client.post(
+        "/lobbylens/commands",
+        data=_CMD_FORMS["watchlist_invalid"],
+        content_type=_FORM_CONTENT_TYPE,
+    )
+    assert resp.status_code == 200
+    assert resp.get_json()["text"].startswith("Usage: ")
+
+
+def test_threshold_set_success(web_client: object, fake_db: FakeSignalsDB) -> None:
+    fake_db.update_result = True
+    resp = web_client.post(
+        "/lobbylens/commands",
+        data=_CMD_FORMS["threshold_set"],
+        content_type=_FORM_CONTENT_TYPE,
+    )
+    assert resp.status_code == 200
+    assert resp.get_json()["text"] == "✅ Set mini-digest threshold to 10 signals"
+
+
+def test_unknown_command(web_client: object, fake_db: FakeSignalsDB) -> None:
+    resp = web_client.post(
+        "/lobbylens/commands",
+        data=_CMD_FORMS["unknown"],
+        content_type=_FORM_CONTENT_TYPE,
+    )
+    assert resp.status_code == 200
+    assert resp.get_json()["text"] == "Unknown command: /unknown"
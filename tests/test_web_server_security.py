@@ -1,48 +1,51 @@
 """Security-focused tests for Slack signature verification in web_server."""
 
-import hashlib
 import hmac
 from unittest.mock import patch
 
+import pytest
+
 from bot.config import settings
-from bot.web_server import create_web_server
-from tests.slack_stubs import StubSlackApp
 
 
 def _sign(body: str, timestamp: str, secret: str) -> str:
     """Generate Slack-style signature for tests."""
-    sig_basestring = f"v0:{timestamp}:{body}"
-    return (
-        "v0="
-        + hmac.new(secret.encode(), sig_basestring.encode(), hashlib.sha256).hexdigest()
-    )
+    mac = hmac.digest(secret.encode(), f"v0:{timestamp}:{body}".encode(), "sha256")
+    return "v0=" + mac.hex()
+
+
+# Fixed request vectors, signed once at import
+_SECRET = "secret"
+_CMD_TS = "1000"
+_EVENT_TS = "2000"
+_STALE_TS = "1000"  # 1000 seconds before _EVENT_TS; allowed window is 300
+
+_MINI_CMD_BODY = "text=mini&command=%2Flobbypulse&channel_id=ch"
+_MINI_CMD_SIG = _sign(_MINI_CMD_BODY, _CMD_TS, _SECRET)
+_DAILY_CMD_BODY = "text=&command=%2Flobbypulse&channel_id=ch"
+_TAMPERED_CMD_SIG = _sign("tampered-body", _CMD_TS, _SECRET)
+
+_EVENT_BODY = '{"type":"event_callback","event":{"type":"message"}}'
+_EVENT_SIG = _sign(_EVENT_BODY, _EVENT_TS, _SECRET)
+_ALTERED_EVENT_SIG = _sign("altered", _EVENT_TS, _SECRET)
+_STALE_EVENT_SIG = _sign(_EVENT_BODY, _STALE_TS, _SECRET)
 
 
 @patch("bot.web_server.run_mini_digest", return_value="mini-digest")
-@patch("bot.web_server.create_signals_database")
 def test_slash_command_accepts_valid_signature(
-    mock_db: object, _mock_digest: object, monkeypatch: object
+    _mock_digest: object, monkeypatch: object, web_client: object
 ) -> None:
     """Requests signed over the raw body should pass verification."""
-    secret = "secret"
-    monkeypatch.setattr(settings, "slack_signing_secret", secret)
+    monkeypatch.setattr(settings, "slack_signing_secret", _SECRET)
     monkeypatch.setattr("bot.web_server.time.time", lambda: 1000.0)
-    mock_db.return_value = None
-
-    app = create_web_server(slack_app=StubSlackApp())
-    client = app.test_client()
-
-    body = "text=mini&command=%2Flobbypulse&channel_id=ch"
-    timestamp = "1000"
-    signature = _sign(body, timestamp, secret)
 
-    resp = client.post(
+    resp = web_client.post(
         "/lobbylens/commands",
-        data=body,
+        data=_MINI_CMD_BODY,
         content_type="application/x-www-form-urlencoded",
         headers={
-            "X-Slack-Request-Timestamp": timestamp,
-            "X-Slack-Signature": signature,
+            "X-Slack-Request-Timestamp": _CMD_TS,
+            "X-Slack-Signature": _MINI_CMD_SIG,
         },
     )
 
@@ -52,28 +55,18 @@ def test_slash_command_accepts_valid_signature(
     assert payload["text"] == "mini-digest"
 
 
-@patch("bot.web_server.create_signals_database")
-def test_event_accepts_valid_signature(mock_db: object, monkeypatch: object) -> None:
+def test_event_accepts_valid_signature(monkeypatch: object, web_client: object) -> None:
     """Events endpoint should accept a correctly signed request."""
-    secret = "secret"
-    monkeypatch.setattr(settings, "slack_signing_secret", secret)
+    monkeypatch.setattr(settings, "slack_signing_secret", _SECRET)
     monkeypatch.setattr("bot.web_server.time.time", lambda: 2000.0)
-    mock_db.return_value = None
 
-    app = create_web_server(slack_app=StubSlackApp())
-    client = app.test_client()
-
-    body = '{"type":"event_callback","event":{"type":"message"}}'
-    timestamp = "2000"
-    signature = _sign(body, timestamp, secret)
-
-    resp = client.post(
+    resp = web_client.post(
         "/lobbylens/events",
-        data=body,
+        data=_EVENT_BODY,
         content_type="application/json",
         headers={
-            "X-Slack-Request-Timestamp": timestamp,
-            "X-Slack-Signature": signature,
+            "X-Slack-Request-Timestamp": _EVENT_TS,
+            "X-Slack-Signature": _EVENT_SIG,
         },
     )
 
@@ -82,60 +75,42 @@ def test_event_accepts_valid_signature(mock_db: object, monkeypatch: object) ->
     assert payload["status"] == "ok"
 
 
-@patch("bot.web_server.create_signals_database")
 def test_slash_command_rejects_invalid_signature(
-    mock_db: object, monkeypatch: object
+    monkeypatch: object, web_client: object
 ) -> None:
     """Invalid signatures should be rejected with 401."""
-    secret = "secret"
-    monkeypatch.setattr(settings, "slack_signing_secret", secret)
+    monkeypatch.setattr(settings, "slack_signing_secret", _SECRET)
     monkeypatch.setattr("bot.web_server.time.time", lambda: 1000.0)
-    mock_db.return_value = None
-
-    app = create_web_server(slack_app=StubSlackApp())
-    client = app.test_client()
 
-    body = "text=&command=%2Flobbypulse&channel_id=ch"
-    timestamp = "1000"
-    bad_signature = _sign("tampered-body", timestamp, secret)
-
-    resp = client.post(
+    resp = web_client.post(
         "/lobbylens/commands",
-        data=body,
+        data=_DAILY_CMD_BODY,
         content_type="application/x-www-form-urlencoded",
         headers={
-            "X-Slack-Request-Timestamp": timestamp,
-            "X-Slack-Signature": bad_signature,
+            "X-Slack-Request-Timestamp": _CMD_TS,
+            "X-Slack-Signature": _TAMPERED_CMD_SIG,
         },
     )
 
     assert resp.status_code == 401
     payload = resp.get_json()
-    assert "Unauthorized" in payload["text"]
+    assert payload["text"] == "Unauthorized: Invalid request signature"
 
 
-@patch("bot.web_server.create_signals_database")
-def test_event_rejects_invalid_signature(mock_db: object, monkeypatch: object) -> None:
+def test_event_rejects_invalid_signature(
+    monkeypatch: object, web_client: object
+) -> None:
     """Events endpoint should reject tampered signatures."""
-    secret = "secret"
-    monkeypatch.setattr(settings, "slack_signing_secret", secret)
+    monkeypatch.setattr(settings, "slack_signing_secret", _SECRET)
     monkeypatch.setattr("bot.web_server.time.time", lambda: 2000.0)
-    mock_db.return_value = None
 
-    app = create_web_server(slack_app=StubSlackApp())
-    client = app.test_client()
-
-    body = '{"type":"event_callback","event":{"type":"message"}}'
-    timestamp = "2000"
-    bad_signature = _sign("altered", timestamp, secret)
-
-    resp = client.post(
+    resp = web_client.post(
         "/lobbylens/events",
-        data=body,
+        data=_EVENT_BODY,
         content_type="application/json",
         headers={
-            "X-Slack-Request-Timestamp": timestamp,
-            "X-Slack-Signature": bad_signature,
+            "X-Slack-Request-Timestamp": _EVENT_TS,
+            "X-Slack-Signature": _ALTERED_EVENT_SIG,
         },
     )
 
@@ -145,29 +120,58 @@ def test_event_rejects_invalid_signature(mock_db: object, monkeypatch: object) -
     assert payload["message"] == "Unauthorized"
 
 
-@patch("bot.web_server.create_signals_database")
-def test_event_rejects_stale_timestamp(mock_db: object, monkeypatch: object) -> None:
-    """Events endpoint should reject replayed requests outside the 5-minute window."""
-    secret = "secret"
-    monkeypatch.setattr(settings, "slack_signing_secret", secret)
-    monkeypatch.setattr("bot.web_server.time.time", lambda: 2000.0)
-    mock_db.return_value = None
+@pytest.mark.parametrize(
+    "path, body, content_type, timestamp",
+    [
+        pytest.param(
+            "/lobbylens/commands",
+            _DAILY_CMD_BODY,
+            "application/x-www-form-urlencoded",
+            _CMD_TS,
+            id="commands",
+        ),
+        pytest.param(
+            "/lobbylens/events", _EVENT_BODY, "application/json", _EVENT_TS, id="events"
+        ),
+    ],
+)
+def test_rejects_non_ascii_signature(
+    monkeypatch: object,
+    web_client: object,
+    path: str,
+    body: str,
+    content_type: str,
+    timestamp: str,
+) -> None:
+    """A non-ASCII signature header is a 401, not a 500 from compare_digest."""
+    monkeypatch.setattr(settings, "slack_signing_secret", _SECRET)
+    monkeypatch.setattr("bot.web_server.time.time", lambda: float(timestamp))
 
-    app = create_web_server()
-    client = app.test_client()
+    resp = web_client.post(
+        path,
+        data=body,
+        content_type=content_type,
+        headers={
+            "X-Slack-Request-Timestamp": timestamp,
+            "X-Slack-Signature": "v0=\u00e9",
+        },
+    )
 
-    body = '{"type":"event_callback","event":{"type":"message"}}'
-    # Timestamp is 1000 seconds old; allowed window is 300.
-    timestamp = "1000"
-    signature = _sign(body, timestamp, secret)
+    assert resp.status_code == 401
 
-    resp = client.post(
+
+def test_event_rejects_stale_timestamp(monkeypatch: object, web_client: object) -> None:
+    """Events endpoint should reject replayed requests outside the 5-minute window."""
+    monkeypatch.setattr(settings, "slack_signing_secret", _SECRET)
+    monkeypatch.setattr("bot.web_server.time.time", lambda: 2000.0)
+
+    resp = web_client.post(
         "/lobbylens/events",
-        data=body,
+        data=_EVENT_BODY,
         content_type="application/json",
         headers={
-            "X-Slack-Request-Timestamp": timestamp,
-            "X-Slack-Signature": signature,
+            "X-Slack-Request-Timestamp": _STALE_TS,
+            "X-Slack-Signature": _STALE_EVENT_SIG,
         },
     )
 